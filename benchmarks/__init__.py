@@ -0,0 +1 @@
+"""Benchmarks of the owradar client, each run as a script."""
@@ -0,0 +1,96 @@
+"""
+Benchmark decoding and applying a state frame, per JSON decoder.
+
+Every available decoder decodes the same synthetic R60ABD1 state frame,
+written by hand in benchmarks/data, from raw bytes and feeds it to
+`update_from_dict`, the work `listen_client()` does for every frame it
+receives. The same state packed as a binary
+`TAG_STATE` record is timed for comparison.
+
+    python benchmarks/decode.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core.binary import STATE, TAG_STATE, decode_frame  # noqa: E402
+from core.r60abd1_models import OwRadarR60abd1Device  # noqa: E402
+
+NUMBER = 20_000
+STATE_FRAME = json.loads(
+    (ROOT / "benchmarks/data/r60abd1_synthetic_frames.json").read_bytes()
+)["state"]
+FRAME = json.dumps(STATE_FRAME).encode()
+
+
+def pack_state(frame: dict) -> bytes:
+    """Pack a JSON state frame as a binary `TAG_STATE` record."""
+    body, heart, breath, sleep = (
+        frame[key] for key in ("body", "heart", "breath", "sleep")
+    )
+    return bytes([TAG_STATE]) + STATE.pack(
+        frame["timestamp"],
+        *frame["motion"]["angle"].values(),
+        *(body[key] for key in ("range", "presence", "energy", "movement", "distance")),
+        *body["location"].values(),
+        heart["rate"],
+        *heart["waves"].values(),
+        breath["info"],
+        breath["rate"],
+        *breath["waves"].values(),
+        *(sleep[key] for key in ("away", "status", "awake", "light", "deep", "score")),
+        *sleep["overview"].values(),
+        *sleep["quality"].values(),
+        *(sleep[key] for key in ("exception", "rating", "struggle", "nobody")),
+    )
+
+
+def decoders() -> dict[str, object]:
+    """Collect the installed JSON decoders."""
+    found: dict[str, object] = {"json": json.loads}
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        found["orjson"] = orjson.loads
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        found["msgspec"] = msgspec.json.decode
+    return found
+
+
+def main() -> None:
+    """Run the benchmark."""
+    device = OwRadarR60abd1Device()
+    print(f"frame: {len(FRAME)} bytes, {NUMBER} iterations")  # noqa: T201
+    for name, loads in decoders().items():
+        decode = timeit.timeit(lambda loads=loads: loads(FRAME), number=NUMBER)
+        total = timeit.timeit(
+            lambda loads=loads: device.state.update_from_dict(loads(FRAME)),
+            number=NUMBER,
+        )
+        print(  # noqa: T201
+            f"{name:>8}: decode {decode / NUMBER * 1e6:6.2f} us"
+            f"  decode+update {total / NUMBER * 1e6:6.2f} us per frame"
+        )
+    record = pack_state(STATE_FRAME)
+    total = timeit.timeit(lambda: decode_frame(device, record), number=NUMBER)
+    print(  # noqa: T201
+        f"{'binary':>8}: {len(record)} bytes"
+        f"  decode+update {total / NUMBER * 1e6:6.2f} us per frame"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark offloading rate estimation to the DSP process pool.
+
+Batches of synthetic heart windows are estimated inline, in the event
+loop, and through `OwRadarDspPool`. For each, the latency of a batch and
+the worst stall of a task ticking every millisecond meanwhile, the lag
+other coroutines would see, are reported.
+
+    python benchmarks/dsp_pool.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from core.dsp import HEART_BAND, estimate_rates  # noqa: E402
+from core.pool import OwRadarDspPool  # noqa: E402
+from rates import windows  # noqa: E402
+
+ROUNDS = 20
+
+
+async def lag_probe(stop: asyncio.Event, lags: list[float]) -> None:
+    """Record how late a one millisecond sleep wakes up."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - started - 0.001)
+
+
+async def run(devices: int, pool: OwRadarDspPool | None) -> tuple[float, float]:
+    """Return the mean latency and the worst loop lag, in milliseconds."""
+    batch = windows(devices)
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(lag_probe(stop, lags))
+    latencies = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        if pool is None:
+            estimate_rates(batch, HEART_BAND)
+        else:
+            await pool.estimate(batch, HEART_BAND)
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.005)
+    stop.set()
+    await probe
+    return sum(latencies) / len(latencies) * 1e3, max(lags) * 1e3
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    pool = OwRadarDspPool()
+    # Start the worker before measuring
+    await asyncio.to_thread(pool.start)
+    await pool.estimate(windows(1), HEART_BAND)
+    try:
+        for devices in (10, 1000, 10000):
+            for label, used in (("inline", None), ("pool", pool)):
+                latency, lag = await run(devices, used)
+                print(  # noqa: T201
+                    f"{devices:>6} devices {label:>6}: latency {latency:7.2f} ms, "
+                    f"worst loop lag {lag:7.2f} ms"
+                )
+        print(  # noqa: T201
+            f"pool: {pool.stats.completed} batches, {pool.stats.dropped} dropped"
+        )
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+"""
+Benchmark a polling round across a fleet of devices.
+
+A local server stands in for 200 devices, one per loopback address, and
+answers `/api/device` after a short delay. A round of updates is sent to
+every device at once, as independent coordinators firing together would,
+then scheduled by `OwRadarFleet` over one poll interval. The peak number
+of requests the network carries at once and the update latency are
+reported.
+
+    python benchmarks/fleet.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core import OwRadarClient, OwRadarFleet  # noqa: E402
+
+DEVICES = 200
+INTERVAL = 2.0
+DELAY = 0.02
+DEVICE = {"info": {"radar_model": "r60abd1", "mac": "00:00:00:00:00:00"}}
+
+
+class Load:
+    """Requests in flight at the server."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.current = 0
+        self.peak = 0
+
+    async def device(self, _request: web.Request) -> web.Response:
+        """Answer like a device, tracking the requests in flight."""
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(DELAY)
+        self.current -= 1
+        return web.json_response(DEVICE)
+
+
+def hosts() -> list[str]:
+    """Return one loopback address per device."""
+    return [f"127.0.{i // 250}.{i % 250 + 1}" for i in range(DEVICES)]
+
+
+async def timed(update: asyncio.Future, since: float, latencies: list) -> None:
+    """Await an update, recording its latency."""
+    await update
+    latencies.append(time.monotonic() - since)
+
+
+async def burst(port: int) -> list[float]:
+    """Update every device at once, sharing a default session."""
+    latencies: list[float] = []
+    async with aiohttp.ClientSession() as session:
+        clients = [OwRadarClient(host, port=port, session=session) for host in hosts()]
+        started = time.monotonic()
+        await asyncio.gather(
+            *(timed(client.update(), started, latencies) for client in clients)
+        )
+    return latencies
+
+
+async def fleet(port: int) -> tuple[list[float], OwRadarFleet]:
+    """Let the fleet poll every device once, at staggered phases."""
+    latencies: list[float] = []
+    done = asyncio.Event()
+    owradar = OwRadarFleet(poll_interval=INTERVAL)
+
+    def polled(_device: object, _error: object) -> None:
+        # Measured by the fleet from the scheduled time of the poll
+        latencies.append(owradar.stats.last_latency)
+        if len(latencies) == DEVICES:
+            done.set()
+
+    for host in hosts():
+        owradar.schedule(owradar.add(host, port=port), polled)
+    await done.wait()
+    await owradar.close()
+    return latencies, owradar
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    load = Load()
+    app = web.Application()
+    app.router.add_get("/api/device", load.device)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "0.0.0.0", 0)  # noqa: S104
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+
+    latencies = await burst(port)
+    print(  # noqa: T201
+        f"burst: peak {load.peak:>3} requests in flight, "
+        f"latency mean {statistics.mean(latencies) * 1e3:6.1f} ms, "
+        f"max {max(latencies) * 1e3:6.1f} ms"
+    )
+    load.peak = 0
+    latencies, owradar = await fleet(port)
+    print(  # noqa: T201
+        f"fleet: peak {load.peak:>3} requests in flight, "
+        f"latency mean {statistics.mean(latencies) * 1e3:6.1f} ms, "
+        f"max {max(latencies) * 1e3:6.1f} ms, "
+        f"success {owradar.stats.success_rate:.0%}"
+    )
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
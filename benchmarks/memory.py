@@ -0,0 +1,80 @@
+"""
+Benchmark the memory held by 1,000 R60ABD1 devices.
+
+The slotted models are compared with replicas of the same dataclasses
+without slots, where every object of the device tree carries its own
+instance dictionary. Devices are filled from the synthetic frames so
+every field holds a plausible value.
+
+    python benchmarks/memory.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, get_type_hints
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core.r60abd1_models import OwRadarR60abd1Device  # noqa: E402
+from core.schema import OwRadarModel, compile_model  # noqa: E402
+
+DEVICES = 1_000
+FRAMES = json.loads(
+    (ROOT / "benchmarks/data/r60abd1_synthetic_frames.json").read_bytes()
+)
+
+
+@cache
+def unslotted(cls: type) -> type:
+    """Return a replica of a model dataclass without slots."""
+    hints = get_type_hints(cls)
+    specs: list[tuple[str, Any, Any]] = []
+    for item in fields(cls):
+        kind = hints[item.name]
+        if isinstance(kind, type) and issubclass(kind, OwRadarModel):
+            kind = unslotted(kind)
+            default = field(default_factory=kind)
+        elif item.default is not MISSING:
+            default = field(default=item.default, metadata=item.metadata)
+        else:
+            default = field(default_factory=item.default_factory)
+        specs.append((item.name, kind, default))
+    # Without slots of its own, the replica gets an instance dictionary.
+    return compile_model(make_dataclass(cls.__name__, specs, bases=(OwRadarModel,)))
+
+
+def measure(cls: type) -> int:
+    """Return the bytes allocated by DEVICES filled devices of a class."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    devices = [cls() for _ in range(DEVICES)]
+    for device in devices:
+        for channel, frame in FRAMES.items():
+            getattr(device, channel).update_from_dict(frame)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for label, cls in (
+        ("dict", unslotted(OwRadarR60abd1Device)),
+        ("slots", OwRadarR60abd1Device),
+    ):
+        size = measure(cls)
+        print(  # noqa: T201
+            f"{label:>6}: {size / 1024:9.1f} KiB per {DEVICES} devices, "
+            f"{size / DEVICES:7.0f} bytes per device"
+        )
+
+
+if __name__ == "__main__":
+    main()
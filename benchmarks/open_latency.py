@@ -0,0 +1,99 @@
+"""
+Benchmark time-to-first-frame of `OwRadarClient.open()`.
+
+A local stand-in device serves `/api/device` and the four WebSocket
+channels, delaying every handshake to mimic a congested Wi-Fi link.
+The sequential baseline connects the channels one after another, the
+way `open()` used to.
+
+    python benchmarks/open_latency.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core import OwRadarClient  # noqa: E402
+from core.client import CHANNELS  # noqa: E402
+
+HANDSHAKE_DELAY = 0.05
+ROUNDS = 20
+DEVICE = {"info": {"radar_model": "r60abd1", "mac": "00:00:00:00:00:00"}}
+
+
+async def device_handler(_: web.Request) -> web.Response:
+    """Serve the device description."""
+    return web.json_response(DEVICE)
+
+
+async def channel_handler(request: web.Request) -> web.WebSocketResponse:
+    """Accept a channel after a delay and push a single frame."""
+    await asyncio.sleep(HANDSHAKE_DELAY)
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    await ws.send_json({"timestamp": int(time.time())})
+    async for _ in ws:
+        pass
+    return ws
+
+
+async def first_frames(client: OwRadarClient) -> None:
+    """Wait until every connected channel delivered a frame."""
+    for channel in client.channels_connected:
+        await getattr(client, f"_{channel}_client").receive()
+
+
+async def sequential(client: OwRadarClient) -> None:
+    """Connect the channels one after another."""
+    for channel in CHANNELS:
+        await getattr(client, f"{channel}_connect")()
+
+
+async def run(port: int, connect: str) -> list[float]:
+    """Measure time-to-first-frame over a number of rounds."""
+    samples = []
+    async with aiohttp.ClientSession() as session:
+        for _ in range(ROUNDS):
+            client = OwRadarClient("127.0.0.1", port=port, session=session)
+            await client.update()
+            start = time.perf_counter()
+            await (client.open() if connect == "concurrent" else sequential(client))
+            await first_frames(client)
+            samples.append(time.perf_counter() - start)
+            await client.close()
+    return samples
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    app = web.Application()
+    app.router.add_get("/api/device", device_handler)
+    for channel in CHANNELS:
+        app.router.add_get(f"/ws/{channel}", channel_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+
+    for connect in ("sequential", "concurrent"):
+        samples = await run(port, connect)
+        print(  # noqa: T201
+            f"{connect:>10}: median {statistics.median(samples) * 1000:7.1f} ms"
+            f"  max {max(samples) * 1000:7.1f} ms"
+        )
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Benchmark the compiled model updaters over the synthetic frames.
+
+Every synthetic R60ABD1 frame is applied with the updaters generated by
+`compile_model` and, for reference, with a reflective updater walking
+the dataclass fields at runtime like the hand-written updaters did,
+default dictionary included. The last column adds JSON decoding, the
+full work done for a text frame.
+
+    python benchmarks/parse.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from dataclasses import fields
+from enum import IntEnum
+from functools import cache
+from pathlib import Path
+from typing import Any, get_type_hints
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core.decoders import json_loads  # noqa: E402
+from core.r60abd1_models import OwRadarR60abd1Device  # noqa: E402
+from core.schema import OwRadarModel  # noqa: E402
+
+NUMBER = 20_000
+FRAMES = json.loads(
+    (ROOT / "benchmarks/data/r60abd1_synthetic_frames.json").read_bytes()
+)
+
+
+@cache
+def spec(cls: type) -> tuple[tuple[str, str, Any], ...]:
+    """Return (attribute, key, type) of every field of a model."""
+    hints = get_type_hints(cls)
+    return tuple(
+        (item.name, item.metadata.get("key", item.name), hints[item.name])
+        for item in fields(cls)
+    )
+
+
+def reflective_update(model: Any, data: dict[str, Any]) -> None:
+    """Update a model by walking its fields, as the hand-written updaters did."""
+    for name, key, kind in spec(type(model)):
+        value = getattr(model, name)
+        if isinstance(kind, type) and issubclass(kind, OwRadarModel):
+            reflective_update(value, data.get(key, {}))
+        elif isinstance(kind, type) and issubclass(kind, IntEnum):
+            setattr(model, name, kind(data.get(key, value)))
+        else:
+            setattr(model, name, data.get(key, value))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(  # noqa: T201
+        f"{'channel':<8}{'reflective':>14}{'compiled':>12}{'json + compiled':>18}"
+    )
+    for channel, frame in FRAMES.items():
+        model = getattr(OwRadarR60abd1Device(), channel)
+        raw = json.dumps(frame).encode()
+        runs = (
+            lambda model=model, frame=frame: reflective_update(model, frame),
+            lambda model=model, frame=frame: model.update_from_dict(frame),
+            lambda model=model, raw=raw: model.update_from_dict(json_loads(raw)),
+        )
+        results = [
+            min(timeit.repeat(run, number=NUMBER, repeat=5)) / NUMBER * 1e6
+            for run in runs
+        ]
+        print(  # noqa: T201
+            f"{channel:<8}{results[0]:>11.2f} us{results[1]:>9.2f} us"
+            f"{results[2]:>15.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
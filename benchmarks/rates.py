@@ -0,0 +1,68 @@
+"""
+Benchmark batched rate estimation against a per-device loop.
+
+Synthetic heart windows of many devices are estimated with one
+`estimate_rates` call over the stacked windows, and with one call per
+device as a Python loop would.
+
+    python benchmarks/rates.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core.dsp import (  # noqa: E402
+    HEART_BAND,
+    RATE_WINDOW,
+    WAVE_SAMPLE_RATE,
+    estimate_rates,
+)
+
+
+def windows(devices: int) -> np.ndarray:
+    """Return noisy heart windows between 55 and 110 BPM."""
+    rng = np.random.default_rng(0)
+    time = np.arange(RATE_WINDOW) / WAVE_SAMPLE_RATE
+    rates = rng.uniform(55, 110, (devices, 1)) / 60
+    return (
+        128
+        + 40 * np.sin(2 * np.pi * rates * time)
+        + rng.normal(0, 8, (devices, RATE_WINDOW))
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for devices in (1, 10, 100, 1000):
+        batch = windows(devices)
+        number = max(1, 2000 // devices)
+        batched = min(
+            timeit.repeat(
+                lambda batch=batch: estimate_rates(batch, HEART_BAND),
+                number=number,
+                repeat=5,
+            )
+        )
+        looped = min(
+            timeit.repeat(
+                lambda batch=batch: [estimate_rates(row, HEART_BAND) for row in batch],
+                number=number,
+                repeat=5,
+            )
+        )
+        print(  # noqa: T201
+            f"{devices:>5} devices: batched {batched / number * 1e3:8.3f} ms, "
+            f"looped {looped / number * 1e3:8.3f} ms per tick"
+        )
+
+
+if __name__ == "__main__":
+    main()
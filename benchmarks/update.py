@@ -0,0 +1,82 @@
+"""
+Benchmark applying frames with and without change tracking.
+
+Every synthetic R60ABD1 frame is applied to a device with the plain
+`update_from_dict` and with `update_changes`, which also returns the
+paths of the fields that changed. Frames are timed twice: repeated, so
+nothing changes, and alternating with a frame where every number moved.
+
+    python benchmarks/update.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components" / "owradar"))
+
+from core.r60abd1_models import OwRadarR60abd1Device  # noqa: E402
+
+NUMBER = 20_000
+FRAMES = json.loads(
+    (ROOT / "benchmarks/data/r60abd1_synthetic_frames.json").read_bytes()
+)
+
+
+# Keys holding enum values, left untouched by `moved()`
+ENUMS = {"range", "presence", "movement", "info", "away", "exception", "rating"}
+ENUMS |= {"struggle", "nobody"}
+
+
+def moved(frame: dict) -> dict:
+    """Return a copy of a frame with every number, but enums, changed."""
+    return {
+        key: moved(value)
+        if isinstance(value, dict)
+        else value + 1
+        if isinstance(value, int | float) and key not in ENUMS
+        else value
+        for key, value in frame.items()
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(  # noqa: T201
+        f"{'channel':<8}{'frames':<12}{'update_from_dict':>18}{'update_changes':>16}"
+    )
+    for channel, frame in FRAMES.items():
+        for label, frames in (
+            ("unchanged", (frame, frame)),
+            ("changed", (frame, moved(frame))),
+        ):
+            device = OwRadarR60abd1Device()
+            model = getattr(device, channel)
+            prefix = f"{channel}."
+
+            def plain(model: Any = model, frames: tuple = frames) -> None:
+                for data in frames:
+                    model.update_from_dict(data)
+
+            def changes(
+                model: Any = model, frames: tuple = frames, prefix: str = prefix
+            ) -> None:
+                for data in frames:
+                    model.update_changes(data, prefix)
+
+            results = [
+                min(timeit.repeat(run, number=NUMBER // 2, repeat=5)) / NUMBER * 1e6
+                for run in (plain, changes)
+            ]
+            print(  # noqa: T201
+                f"{channel:<8}{label:<12}{results[0]:>15.2f} us{results[1]:>13.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
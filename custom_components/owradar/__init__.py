@@ -11,6 +11,8 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import OwRadarDataUpdateCoordinator
+from .estimator import async_get_estimator
+from .vitals import OwRadarVitalStatistics
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -22,10 +24,25 @@ PLATFORMS: list[Platform] = [
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OwRadar from a config entry."""
     coordinator = OwRadarDataUpdateCoordinator(hass, entry=entry)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Leave the fleet, so that a retry can add the device again
+        await coordinator.async_disconnect()
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    # Estimate heart and breath rates from the waveforms, batched per tick.
+    entry.async_on_unload(async_get_estimator(hass).async_register(coordinator))
+    # Summarize the waves for the recorder, see the wave aggregate sensors.
+    entry.async_on_unload(coordinator.async_start_aggregation())
+    # Import the statistics of the vital signs, rather than every change.
+    if "recorder" in hass.config.components:
+        entry.async_on_unload(
+            OwRadarVitalStatistics(hass, coordinator).async_start()
+        )
+
     # Set up all platforms for this device/entry.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -41,9 +58,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator: OwRadarDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
         # Ensure disconnected and cleanup stop sub
-        await coordinator.client.disconnect()
-        if coordinator.unsub:
-            coordinator.unsub()
+        await coordinator.async_disconnect()
 
         del hass.data[DOMAIN][entry.entry_id]
 
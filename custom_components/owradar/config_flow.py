@@ -5,13 +5,14 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import onboarding, zeroconf
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_HOST, CONF_MAC
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
-from .core import OwRadarClient, OwRadarConnectionError
+from .const import CONF_SHORT_TERM_STATISTICS, DOMAIN
+from .core import OwRadarClient, OwRadarConnectionError, OwRadarRequestPriority
 
 
 class OwRadarFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -21,6 +22,12 @@ class OwRadarFlowHandler(ConfigFlow, domain=DOMAIN):
     discovered_host: str
     discovered_device: Any
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return OwRadarOptionsFlowHandler(config_entry)
+
     async def async_step_user(
             self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -99,4 +106,33 @@ class OwRadarFlowHandler(ConfigFlow, domain=DOMAIN):
         """Get device information from device."""
         session = async_get_clientsession(self.hass)
         client = OwRadarClient(host, session=session)
-        return await client.update()
+        return await client.update(priority=OwRadarRequestPriority.PROBE)
+
+
+class OwRadarOptionsFlowHandler(OptionsFlow):
+    """Options flow for device."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+            self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SHORT_TERM_STATISTICS,
+                        default=self.config_entry.options.get(
+                            CONF_SHORT_TERM_STATISTICS, False
+                        ),
+                    ): bool,
+                }
+            ),
+        )
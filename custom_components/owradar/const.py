@@ -5,6 +5,30 @@ from logging import Logger, getLogger
 LOGGER: Logger = getLogger(__package__)
 SCAN_INTERVAL = timedelta(seconds=10)
 
+# Backoff bounds (seconds) between WebSocket reconnect attempts.
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+
+# Waveform samples exposed by the waves sensor, per wave.
+WAVEFORM_SAMPLES = 100
+
+# Interval between two batched rate estimations of every device, and the
+# dispatcher signal of an entry once its rates have been estimated.
+RATE_INTERVAL = timedelta(seconds=5)
+SIGNAL_RATES = "owradar_rates_{}"
+
+# Window of the wave aggregate sensors, and the dispatcher signal of an
+# entry once its waves have been aggregated.
+AGGREGATE_INTERVAL = timedelta(seconds=30)
+SIGNAL_AGGREGATES = "owradar_aggregates_{}"
+
+# Shortest interval between two states of the rate limited sensors.
+SENSOR_MIN_INTERVAL = timedelta(seconds=5)
+
+# Option importing 5 minute vital sign statistics, which goes through a
+# private recorder API, off by default.
+CONF_SHORT_TERM_STATISTICS = "short_term_statistics"
+
 NAME = "OwRadar"
 DOMAIN = "owradar"
 VERSION = "0.0.1-a+20240828"
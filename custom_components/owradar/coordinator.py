@@ -1,21 +1,49 @@
 """DataUpdateCoordinator for owradar."""
 from __future__ import annotations
 
-import asyncio
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER, SCAN_INTERVAL
+from .const import (
+    AGGREGATE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+    SCAN_INTERVAL,
+    SIGNAL_AGGREGATES,
+)
 from .core import (
-    OwRadarClient,
     OwRadarClosedConnectionError,
     OwRadarError,
+    OwRadarFleet,
 )
+from .core.waves import OwRadarWaveAggregate, aggregate
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .core.dsp import OwRadarRate
+
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> OwRadarFleet:
+    """Return the fleet shared by every OwRadar device."""
+    if (fleet := hass.data.get(DATA_FLEET)) is None:
+        fleet = hass.data[DATA_FLEET] = OwRadarFleet(
+            poll_interval=SCAN_INTERVAL.total_seconds(),
+            reconnect_min_delay=RECONNECT_MIN_DELAY,
+            reconnect_max_delay=RECONNECT_MAX_DELAY,
+        )
+    return fleet
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -31,74 +59,159 @@ class OwRadarDataUpdateCoordinator(DataUpdateCoordinator):
             entry: ConfigEntry,
     ) -> None:
         """Initialize."""
-        self.client = OwRadarClient(
-            entry.data[CONF_HOST], session=async_get_clientsession(hass)
-        )
+        # Polls and the WebSocket listener are run by the fleet, which
+        # staggers the polls of every device over SCAN_INTERVAL.
+        self.fleet = async_get_fleet(hass)
+        self.client = self.fleet.add(entry.data[CONF_HOST])
         self.unsub: CALLBACK_TYPE | None = None
+        self._unsub_fleet: list[CALLBACK_TYPE] = []
+        self._push_active = False
+        self._push_listeners: list[CALLBACK_TYPE] = []
+        # Latest rate estimates by wave, see estimator.py
+        self.rates: dict[str, OwRadarRate] = {}
+        # Latest wave aggregates by wave, and the samples aggregated so far
+        self.aggregates: dict[str, OwRadarWaveAggregate] = {}
+        self._aggregated: dict[str, int] = {}
 
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=None,
         )
 
     @callback
     def _use_websocket(self) -> None:
-        """Use WebSocket for updates, instead of polling."""
-
-        async def listen() -> None:
-            """Listen for state changes via WebSocket."""
-            try:
-                await self.client.open()
-            except OwRadarError as err:
-                self.logger.info(err)
-                if self.unsub:
-                    self.unsub()
-                    self.unsub = None
-                return
-
-            try:
-                asyncio.run(self.client.listen(callback=self.async_set_updated_data))
-            except OwRadarClosedConnectionError as err:
-                self.last_update_success = False
-                self.logger.info(err)
-            except OwRadarError as err:
-                self.last_update_success = False
-                self.async_update_listeners()
-                self.logger.error(err)
-
-            # Ensure we are disconnected
-            await self.client.close()
-            if self.unsub:
-                self.unsub()
-                self.unsub = None
+        """Use WebSocket for updates, polling only while it is down."""
 
         async def close_websocket(_: Event) -> None:
             """Close WebSocket connection."""
             self.unsub = None
-            await self.client.close()
+            await self.async_disconnect()
 
         # Clean disconnect WebSocket on Home Assistant shutdown
         self.unsub = self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP, close_websocket
         )
 
-        # Start listening
-        self.config_entry.async_create_background_task(
-            self.hass, listen(), "owradar-listen"
+        # Start listening, and polling while push is down
+        self._unsub_fleet = [
+            self.fleet.supervise(
+                self.client, self._async_push_update, self._async_push_changed
+            ),
+            self.fleet.schedule(self.client, self._async_polled),
+        ]
+
+    @callback
+    def _async_push_changed(self, *, active: bool, error: Exception | None) -> None:
+        """Log the state of the WebSocket listener, refreshing once it is lost."""
+        # Unexpected errors have been logged by the fleet already
+        if isinstance(error, OwRadarClosedConnectionError):
+            self.logger.info(error)
+        elif isinstance(error, OwRadarError):
+            log = self.logger.debug if not self._push_active else self.logger.error
+            log(error)
+        if active or not self._push_active:
+            self._push_active = active
+            return
+        # Poll right away rather than at the next phase of the fleet
+        self._push_active = False
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_polled(self, device: Any, error: Exception | None) -> None:
+        """Handle a scheduled poll of the fleet."""
+        if error is not None:
+            self.async_set_update_error(error)
+        else:
+            self.async_set_updated_data(device)
+
+    @callback
+    def async_add_field_listener(
+        self, update_callback: CALLBACK_TYPE, fields: tuple[str, ...] | None
+    ) -> CALLBACK_TYPE:
+        """
+        Listen for pushed changes of the given device fields.
+
+        Listeners added with `async_add_listener` are only woken by polls;
+        while push is active a frame only wakes the listeners of the fields
+        it changed. Without fields, the listener is woken by every frame;
+        with an empty tuple, by none.
+        """
+        if fields is None:
+            self._push_listeners.append(update_callback)
+            return lambda: self._push_listeners.remove(update_callback)
+        if not fields:
+            return lambda: None
+
+        @callback
+        def field_changed(_device: Any, _changed: frozenset[str]) -> None:
+            # While polling, every listener is woken by the refresh already
+            if self._push_active:
+                update_callback()
+
+        return self.client.subscribe(field_changed, *fields)
+
+    @callback
+    def _async_push_update(self, device: Any) -> None:
+        """Handle a device pushed by the WebSocket listener."""
+        if self.data is not device or not self.last_update_success:
+            self.async_set_updated_data(device)
+            return
+        for update_callback in list(self._push_listeners):
+            update_callback()
+
+    @callback
+    def async_start_aggregation(self) -> CALLBACK_TYPE:
+        """Aggregate the waves every AGGREGATE_INTERVAL until cancelled."""
+        self._aggregated = {
+            wave: buffer.total for wave, buffer in self.client.waves.items()
+        }
+        return async_track_time_interval(
+            self.hass, self._async_aggregate_waves, AGGREGATE_INTERVAL
         )
 
+    @callback
+    def _async_aggregate_waves(self, _now: datetime) -> None:
+        """Summarize the wave samples received during the last window."""
+        changed = False
+        for wave, buffer in self.client.waves.items():
+            summary = aggregate(buffer.since(self._aggregated.get(wave, 0)))
+            self._aggregated[wave] = buffer.total
+            if summary is not None:
+                self.aggregates[wave] = summary
+            elif self.aggregates.pop(wave, None) is None:
+                continue
+            changed = True
+        if changed:
+            async_dispatcher_send(
+                self.hass, SIGNAL_AGGREGATES.format(self.config_entry.entry_id)
+            )
+
+    async def async_disconnect(self) -> None:
+        """Stop the WebSocket listener and disconnect from the device."""
+        while self._unsub_fleet:
+            self._unsub_fleet.pop()()
+        if self.unsub:
+            self.unsub()
+            self.unsub = None
+        await self.fleet.remove(self.client)
+
     async def _async_update_data(self) -> Any:
         """Fetch data from device."""
-        # If the device supports a WebSocket, try activating it.
+        # Push is healthy, the WebSocket listener keeps the data fresh.
+        if self.client.connected:
+            return self.data
+
         try:
-            device = await self.client.update(full_update=not self.last_update_success)
+            device = await self.fleet.poll(
+                self.client, full_update=self.data is not None
+            )
         except OwRadarError as error:
             raise UpdateFailed(f"Invalid response from API: {error}") from error
 
         # If the device supports a WebSocket, try activating it.
-        # if not self.client.connected and not self.unsub:
-        #     self._use_websocket()
+        if not self._unsub_fleet and not self.unsub:
+            self._use_websocket()
 
         return device
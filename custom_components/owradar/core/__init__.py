@@ -2,18 +2,25 @@
 
 from .client import OwRadarClient
 from .exceptions import (
+    OwRadarCircuitOpenError,
     OwRadarClosedConnectionError,
     OwRadarConnectionError,
     OwRadarTimeoutConnectionError,
     OwRadarError,
     OwRadarUpgradeError,
 )
+from .fleet import OwRadarFleet, OwRadarFleetStats
+from .hostqueue import OwRadarRequestPriority
 
 __all__ = [
+    "OwRadarCircuitOpenError",
     "OwRadarClient",
     "OwRadarClosedConnectionError",
     "OwRadarConnectionError",
     "OwRadarTimeoutConnectionError",
     "OwRadarError",
+    "OwRadarFleet",
+    "OwRadarFleetStats",
+    "OwRadarRequestPriority",
     "OwRadarUpgradeError",
 ]
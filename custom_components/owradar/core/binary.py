@@ -0,0 +1,259 @@
+"""
+Binary frame decoder for OwRadar.
+
+Devices that accept the `BINARY_PROTOCOL` WebSocket sub-protocol send
+packed little-endian records instead of JSON. Every record starts with a
+one byte tag followed by a fixed layout:
+
+    TAG_STATE  full R60ABD1 state, see `STATE`
+    TAG_WAVES  timestamp, heart rate and waves, breath rate and waves
+    TAG_STATS  status, breath, heart, turn
+    TAG_SNAP   body, location, heart, breath and sleep snapshot
+    TAG_EVENT  status
+
+Records are unpacked straight from the frame buffer into the device
+models, without building intermediate dictionaries. Enumerations are
+converted through the shared tables of `schema.enum_table`. Records with
+an unknown tag, e.g. from a newer firmware, or too short are skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from typing import TYPE_CHECKING
+
+from .r60abd1_models import (
+    OwRadarR60abd1StateBodyMovement,
+    OwRadarR60abd1StateBodyPresence,
+    OwRadarR60abd1StateBodyRange,
+    OwRadarR60abd1StateBreathInfo,
+    OwRadarR60abd1StateSleepAway,
+    OwRadarR60abd1StateSleepException,
+    OwRadarR60abd1StateSleepNobody,
+    OwRadarR60abd1StateSleepRating,
+    OwRadarR60abd1StateSleepStatus,
+    OwRadarR60abd1StateSleepStruggle,
+)
+from .schema import enum_table
+
+if TYPE_CHECKING:
+    from .r60abd1_models import (
+        OwRadarR60abd1Device,
+        OwRadarR60abd1Event,
+        OwRadarR60abd1Snap,
+        OwRadarR60abd1State,
+        OwRadarR60abd1Stats,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+BINARY_PROTOCOL = "owradar.bin.v1"
+
+TAG_STATE = 0x01
+TAG_WAVES = 0x02
+TAG_STATS = 0x03
+TAG_SNAP = 0x04
+TAG_EVENT = 0x05
+
+# timestamp, motion pitch/roll,
+# body range/presence/energy/movement/distance, location x/y/z,
+# heart rate, waves w0-w4, breath info/rate, waves w0-w4,
+# sleep away/status/awake/light/deep/score,
+# overview presence/status/breath/heart/turn/leratio/seratio/pause,
+# quality score/duration/awake/light/deep/aduration/away/turn/breath/heart/pause,
+# sleep exception/rating/struggle/nobody
+STATE = struct.Struct("<Iff4BH3h6B7B2B3HB8BB5H5B4B")
+WAVES = struct.Struct("<I6B6B")
+STATS = struct.Struct("<3BH")
+SNAP = struct.Struct("<4BH2h3B")
+EVENT = struct.Struct("<B")
+
+BODY_RANGE = enum_table(OwRadarR60abd1StateBodyRange)
+BODY_PRESENCE = enum_table(OwRadarR60abd1StateBodyPresence)
+BODY_MOVEMENT = enum_table(OwRadarR60abd1StateBodyMovement)
+BREATH_INFO = enum_table(OwRadarR60abd1StateBreathInfo)
+SLEEP_AWAY = enum_table(OwRadarR60abd1StateSleepAway)
+SLEEP_STATUS = enum_table(OwRadarR60abd1StateSleepStatus)
+SLEEP_EXCEPTION = enum_table(OwRadarR60abd1StateSleepException)
+SLEEP_RATING = enum_table(OwRadarR60abd1StateSleepRating)
+SLEEP_STRUGGLE = enum_table(OwRadarR60abd1StateSleepStruggle)
+SLEEP_NOBODY = enum_table(OwRadarR60abd1StateSleepNobody)
+
+
+def decode_state(state: OwRadarR60abd1State, view: memoryview) -> None:
+    """Update the state in place from a `TAG_STATE` record."""
+    angle = state.motion.angle
+    body = state.body
+    location = body.location
+    heart = state.heart
+    heart_waves = heart.waves
+    breath = state.breath
+    breath_waves = breath.waves
+    sleep = state.sleep
+    overview = sleep.overview
+    quality = sleep.quality
+    (
+        state.timestamp,
+        angle.pitch,
+        angle.roll,
+        body_range,
+        body_presence,
+        body.energy,
+        body_movement,
+        body.distance,
+        location.x,
+        location.y,
+        location.z,
+        heart.rate,
+        heart_waves.w0,
+        heart_waves.w1,
+        heart_waves.w2,
+        heart_waves.w3,
+        heart_waves.w4,
+        breath_info,
+        breath.rate,
+        breath_waves.w0,
+        breath_waves.w1,
+        breath_waves.w2,
+        breath_waves.w3,
+        breath_waves.w4,
+        sleep_away,
+        sleep_status,
+        sleep.awake,
+        sleep.light,
+        sleep.deep,
+        sleep.score,
+        overview_presence,
+        overview_status,
+        overview.breath,
+        overview.heart,
+        overview.turn,
+        overview.leratio,
+        overview.seratio,
+        overview.pause,
+        quality.score,
+        quality.duration,
+        quality.awake,
+        quality.light,
+        quality.deep,
+        quality.aduration,
+        quality.away,
+        quality.turn,
+        quality.breath,
+        quality.heart,
+        quality.pause,
+        sleep_exception,
+        sleep_rating,
+        sleep_struggle,
+        sleep_nobody,
+    ) = STATE.unpack_from(view, 1)
+    body.range = BODY_RANGE[body_range]
+    body.presence = BODY_PRESENCE[body_presence]
+    body.movement = BODY_MOVEMENT[body_movement]
+    breath.info = BREATH_INFO[breath_info]
+    sleep.away = SLEEP_AWAY[sleep_away]
+    sleep.status = SLEEP_STATUS[sleep_status]
+    overview.presence = BODY_PRESENCE[overview_presence]
+    overview.status = SLEEP_STATUS[overview_status]
+    sleep.exception = SLEEP_EXCEPTION[sleep_exception]
+    sleep.rating = SLEEP_RATING[sleep_rating]
+    sleep.struggle = SLEEP_STRUGGLE[sleep_struggle]
+    sleep.nobody = SLEEP_NOBODY[sleep_nobody]
+
+
+def decode_waves(state: OwRadarR60abd1State, view: memoryview) -> None:
+    """Update the state in place from a `TAG_WAVES` record."""
+    heart = state.heart
+    heart_waves = heart.waves
+    breath = state.breath
+    breath_waves = breath.waves
+    (
+        state.timestamp,
+        heart.rate,
+        heart_waves.w0,
+        heart_waves.w1,
+        heart_waves.w2,
+        heart_waves.w3,
+        heart_waves.w4,
+        breath.rate,
+        breath_waves.w0,
+        breath_waves.w1,
+        breath_waves.w2,
+        breath_waves.w3,
+        breath_waves.w4,
+    ) = WAVES.unpack_from(view, 1)
+
+
+def decode_stats(stats: OwRadarR60abd1Stats, view: memoryview) -> None:
+    """Update the stats in place from a `TAG_STATS` record."""
+    (stats.status, stats.breath, stats.heart, stats.turn) = STATS.unpack_from(view, 1)
+
+
+def decode_snap(snap: OwRadarR60abd1Snap, view: memoryview) -> None:
+    """Update the snap in place from a `TAG_SNAP` record."""
+    (
+        snap.body_range,
+        snap.body_presence,
+        snap.body_energy,
+        snap.body_movement,
+        snap.body_distance,
+        snap.body_location_x,
+        snap.body_location_y,
+        snap.heart_rate,
+        snap.breath_rate,
+        snap.sleep_away,
+    ) = SNAP.unpack_from(view, 1)
+
+
+def decode_event(event: OwRadarR60abd1Event, view: memoryview) -> None:
+    """Update the event in place from a `TAG_EVENT` record."""
+    (event.status,) = EVENT.unpack_from(view, 1)
+
+
+# Record tag -> (channel, layout, decoder)
+RECORDS = {
+    TAG_STATE: ("state", STATE, decode_state),
+    TAG_WAVES: ("state", WAVES, decode_waves),
+    TAG_STATS: ("stats", STATS, decode_stats),
+    TAG_SNAP: ("snap", SNAP, decode_snap),
+    TAG_EVENT: ("event", EVENT, decode_event),
+}
+
+
+# Unknown tags already warned about, later records are only logged at debug
+_UNKNOWN_TAGS: set[int] = set()
+
+
+def decode_frame(device: OwRadarR60abd1Device, data: bytes) -> str | None:
+    """
+    Update the device in place from a binary frame.
+
+    Args:
+    ----
+        device: The device to update.
+        data: The binary frame as received from the device.
+
+    Returns:
+    -------
+        The channel the record belongs to, None when the record has been
+        skipped because it is truncated or carries an unknown tag.
+
+    """
+    view = memoryview(data)
+    if not view:
+        _LOGGER.debug("Skipped an empty binary frame")
+        return None
+    if (record := RECORDS.get(tag := view[0])) is None:
+        log = _LOGGER.debug if tag in _UNKNOWN_TAGS else _LOGGER.warning
+        _UNKNOWN_TAGS.add(tag)
+        log("Skipped a binary frame with the unknown record tag 0x%02x", tag)
+        return None
+    channel, layout, decode = record
+    if len(view) < layout.size + 1:
+        _LOGGER.debug(
+            "Skipped a truncated binary `%s` frame of %s bytes", channel, len(view)
+        )
+        return None
+    decode(getattr(device, channel), view)
+    return channel
@@ -0,0 +1,150 @@
+"""
+Per-device circuit breaker for OwRadar.
+
+An offline device otherwise costs a full request timeout on every poll and
+every setting. After `failure_threshold` connection failures in a row the
+breaker of the device opens: requests fail at once, without touching the
+network. Once the open period is over, a TCP connect to the device, much
+cheaper than a timed out request, probes it; if it answers, the breaker is
+half-open and lets one request through, which closes it again on success.
+Each failed probe or trial doubles the open period, up to `open_max`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+
+import async_timeout
+
+from .exceptions import OwRadarCircuitOpenError
+from .hosts import OwRadarHostRegistry
+
+
+class OwRadarBreakerState(StrEnum):
+    """Enumeration representing the state of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class OwRadarCircuitBreaker:
+    """Circuit breaker of the requests sent to a device."""
+
+    host: str
+    port: int
+    failure_threshold: int = 3
+    # Seconds the breaker stays open, doubled by every failed probe or trial
+    open_min: float = 5.0
+    open_max: float = 300.0
+    probe_timeout: float = 2.0
+
+    state: OwRadarBreakerState = OwRadarBreakerState.CLOSED
+    failures: int = 0
+    # Times the breaker opened, and requests it rejected
+    trips: int = 0
+    rejected: int = 0
+    _open_for: float = 0.0
+    _retry_at: float = 0.0
+    _trial: bool = False
+
+    def check(self) -> None:
+        """
+        Fail fast while the breaker is open.
+
+        Raises
+        ------
+            OwRadarCircuitOpenError: The breaker is open, and not due for a
+                probe yet.
+
+        """
+        if self.state is OwRadarBreakerState.CLOSED:
+            return
+        if self.state is OwRadarBreakerState.HALF_OPEN:
+            if not self._trial:
+                return
+        elif time.monotonic() >= self._retry_at:
+            return
+        self.rejected += 1
+        msg = f"Device at {self.host} is unreachable, not sending the request"
+        raise OwRadarCircuitOpenError(msg)
+
+    async def acquire(self) -> None:
+        """
+        Let a request through, probing the device first once due.
+
+        Raises
+        ------
+            OwRadarCircuitOpenError: The breaker is open, or the device did
+                not answer the probe.
+
+        """
+        self.check()
+        if self.state is OwRadarBreakerState.CLOSED:
+            return
+        if self.state is OwRadarBreakerState.OPEN:
+            if not await self._probe():
+                self._trip()
+                self.rejected += 1
+                msg = f"Device at {self.host} is unreachable, probe failed"
+                raise OwRadarCircuitOpenError(msg)
+            self.state = OwRadarBreakerState.HALF_OPEN
+        # The one trial request of the half-open breaker
+        self._trial = True
+
+    def record(self, *, success: bool | None) -> None:
+        """
+        Record the outcome of a request let through.
+
+        Args:
+        ----
+            success: Whether the device answered, even with an error status,
+                None when the request ended otherwise, e.g. cancelled.
+
+        """
+        if success is None:
+            self._trial = False
+            return
+        if success:
+            self.state = OwRadarBreakerState.CLOSED
+            self.failures = 0
+            self._open_for = 0.0
+            self._trial = False
+            return
+        self.failures += 1
+        if (
+            self.state is OwRadarBreakerState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self._trip()
+
+    def _trip(self) -> None:
+        """Open the breaker, for twice as long as the last time."""
+        if self.state is not OwRadarBreakerState.OPEN:
+            self.trips += 1
+        self.state = OwRadarBreakerState.OPEN
+        self._trial = False
+        self._open_for = min(self.open_max, max(self.open_min, self._open_for * 2))
+        self._retry_at = time.monotonic() + self._open_for
+
+    async def _probe(self) -> bool:
+        """Return whether the device accepts a TCP connection."""
+        try:
+            async with async_timeout.timeout(self.probe_timeout):
+                _, writer = await asyncio.open_connection(self.host, self.port)
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        return True
+
+
+_BREAKERS = OwRadarHostRegistry(OwRadarCircuitBreaker)
+
+
+def host_breaker(host: str, port: int) -> OwRadarCircuitBreaker:
+    """Return the circuit breaker of a device."""
+    return _BREAKERS.get(host, port)
@@ -0,0 +1,121 @@
+"""
+Incremental time-weighted statistics for OwRadar values.
+
+`OwRadarBucketSeries` folds a changing value into fixed, wall-clock
+aligned periods, e.g. 5 minutes or an hour, as it changes. A value counts
+for as long as it holds, like the statistics of a Home Assistant
+measurement sensor, so a value seen once in an hour weighs more than one
+replaced a second later. Nothing is buffered besides the open period.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class OwRadarBucket:
+    """Statistics of a value over one period."""
+
+    # Epoch seconds of the start of the period
+    start: float
+    # Seconds during which a value was held
+    duration: float = 0.0
+    # Integral of the value over the duration
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    @property
+    def mean(self) -> float | None:
+        """Return the time-weighted mean, None without any value."""
+        return self.total / self.duration if self.duration else None
+
+    def hold(self, value: float, seconds: float) -> None:
+        """Account for a value held during seconds."""
+        self.duration += seconds
+        self.total += value * seconds
+        self.see(value)
+
+    def see(self, value: float) -> None:
+        """Account for a value in the minimum and maximum."""
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+
+class OwRadarBucketSeries:
+    """Time-weighted mean, minimum and maximum of a value per period."""
+
+    def __init__(self, period: float) -> None:
+        """
+        Initialize.
+
+        Args:
+        ----
+            period: The length of a period in seconds, e.g. 3600.
+
+        """
+        self.period = period
+        self._bucket: OwRadarBucket | None = None
+        self._value: float | None = None
+        self._since = 0.0
+
+    def update(self, value: float | None, now: float) -> list[OwRadarBucket]:
+        """
+        Record a new value.
+
+        Args:
+        ----
+            value: The new value, None while there is no reading.
+            now: The current time, in epoch seconds.
+
+        Returns:
+        -------
+            The periods that ended before now and held a value.
+
+        """
+        closed = self.flush(now)
+        self._value = value
+        if value is not None:
+            self._bucket_at(now).see(value)
+        return closed
+
+    def flush(self, now: float) -> list[OwRadarBucket]:
+        """
+        Account for the held value up to now, closing the ended periods.
+
+        Args:
+        ----
+            now: The current time, in epoch seconds.
+
+        Returns:
+        -------
+            The periods that ended before now and held a value.
+
+        """
+        closed: list[OwRadarBucket] = []
+        bucket = self._bucket
+        while bucket is not None:
+            end = bucket.start + self.period
+            if self._value is not None:
+                bucket.hold(self._value, min(now, end) - self._since)
+            self._since = min(now, end)
+            if now < end:
+                break
+            if bucket.duration:
+                closed.append(bucket)
+            # Periods without a held value are skipped at once
+            bucket = self._bucket = (
+                OwRadarBucket(end) if self._value is not None else None
+            )
+        if self._bucket is None:
+            self._since = now
+        return closed
+
+    def _bucket_at(self, now: float) -> OwRadarBucket:
+        """Return the open period, opening the one of now if needed."""
+        if self._bucket is None:
+            self._bucket = OwRadarBucket(now - now % self.period)
+            self._since = now
+        return self._bucket
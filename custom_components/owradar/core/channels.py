@@ -0,0 +1,225 @@
+"""WebSocket channel bookkeeping for OwRadar."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Queued by `OwRadarFrameQueue.close()` to end the iteration of the consumer
+_CLOSED = object()
+
+
+class OwRadarQueuePolicy(StrEnum):
+    """Enumeration representing what a full receive queue does with a new frame."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+
+
+@dataclass
+class OwRadarChannelStats:
+    """Object holding supervision statistics of a WebSocket channel."""
+
+    restarts: int = 0
+    failures: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    # Reconnects because no frame arrived in time, see OwRadarChannelWatchdog
+    stale: int = 0
+    # Frames not applied, e.g. binary records of an unknown type
+    skipped: int = 0
+    connected_at: float | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return if the channel is currently connected."""
+        return self.connected_at is not None
+
+    @property
+    def uptime(self) -> float:
+        """
+        Return the time the channel has been connected without interruption.
+
+        Returns
+        -------
+            Uptime in seconds, 0 while disconnected.
+
+        """
+        if self.connected_at is None:
+            return 0.0
+        return time.monotonic() - self.connected_at
+
+    def mark_connected(self) -> None:
+        """Record a (re)connected channel."""
+        if self.connected_at is None:
+            self.connected_at = time.monotonic()
+        self.failures = 0
+
+    def mark_disconnected(self) -> None:
+        """Record a dropped channel."""
+        self.connected_at = None
+        self.failures += 1
+
+
+@dataclass
+class OwRadarChannelWatchdog:
+    """
+    Object tracking the cadence of the frames of a WebSocket channel.
+
+    The expected period between two frames is the one configured on the
+    device when there is one, otherwise the one observed: a smoothed mean
+    and deviation of the inter-arrival times, kept across reconnects. A
+    channel that has delivered frames is stale once `misses` periods go by
+    without one. A stale channel that stays silent after its reconnect
+    doubles the wait, in case the device simply has nothing to report.
+    """
+
+    misses: int = 3
+    # Shortest wait, however fast the frames arrive
+    minimum: float = 2.0
+    # Inter-arrival times observed before the period is trusted
+    warmup: int = 4
+    mean: float | None = None
+    deviation: float = 0.0
+    samples: int = 0
+    _seen: bool = False
+    _last: float | None = None
+    _backoff: int = 0
+
+    def period(self, configured: float | None = None) -> float | None:
+        """Return the expected period between frames, None if unknown."""
+        if configured:
+            return configured
+        if self.mean is None or self.samples < self.warmup:
+            return None
+        return self.mean + 4 * self.deviation
+
+    def timeout(self, configured: float | None = None) -> float | None:
+        """
+        Return how long to wait for the next frame.
+
+        Args:
+        ----
+            configured: The period configured on the device, in seconds.
+
+        Returns:
+        -------
+            The wait in seconds, None until the channel delivered a frame
+            and its period is known.
+
+        """
+        if not self._seen or (period := self.period(configured)) is None:
+            return None
+        return max(self.minimum, self.misses * period) * 2**self._backoff
+
+    def frame(self, now: float) -> None:
+        """Record a frame received at now, in monotonic seconds."""
+        if self._last is not None:
+            interval = now - self._last
+            if self.mean is None:
+                self.mean = interval
+                self.deviation = interval / 2
+            else:
+                self.deviation += (abs(interval - self.mean) - self.deviation) / 4
+                self.mean += (interval - self.mean) / 8
+            self.samples += 1
+        self._seen = True
+        self._last = now
+        self._backoff = 0
+
+    def connected(self) -> None:
+        """Record a (re)connected channel, the gap is not an interval."""
+        self._last = None
+
+    def expired(self) -> None:
+        """Record a stale channel, about to be reconnected."""
+        self._backoff = min(self._backoff + 1, 6)
+
+
+@dataclass(frozen=True, slots=True)
+class OwRadarFrame:
+    """
+    Object holding a frame received from a WebSocket channel.
+
+    `data` is the frame as decoded, a dict for JSON or bytes for binary
+    frames. `model` is the live channel model the frame has been applied
+    to, it keeps changing as further frames arrive.
+    """
+
+    channel: str
+    timestamp: float
+    data: Any
+    model: Any
+
+
+class OwRadarFrameQueue:
+    """
+    Bounded queue between a WebSocket reader and its consumer.
+
+    With `BLOCK` the reader waits for room, pushing back on the socket.
+    `DROP_OLDEST` discards the oldest pending item, `CONFLATE` keeps only
+    the latest one. Discarded items are counted in the channel statistics.
+    Items are consumed through `consume()`, or by iterating the queue until
+    it is closed.
+    """
+
+    def __init__(
+        self, maxsize: int, policy: OwRadarQueuePolicy, stats: OwRadarChannelStats
+    ) -> None:
+        """Initialize."""
+        self.policy = OwRadarQueuePolicy(policy)
+        self.stats = stats
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(
+            1 if self.policy is OwRadarQueuePolicy.CONFLATE else maxsize
+        )
+
+    async def put(self, item: Any) -> None:
+        """Queue an item according to the policy."""
+        if self.policy is OwRadarQueuePolicy.BLOCK:
+            await self._queue.put(item)
+            return
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Queue an item without waiting, making room when the queue is full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+            if self.policy is OwRadarQueuePolicy.CONFLATE:
+                self.stats.conflated += 1
+            else:
+                self.stats.dropped += 1
+        self._queue.put_nowait(item)
+
+    def close(self) -> None:
+        """End the iteration of the queue, without waiting."""
+        self.put_nowait(_CLOSED)
+
+    def __aiter__(self) -> Self:
+        """Return the iterator over the queued items."""
+        return self
+
+    async def __anext__(self) -> Any:
+        """Wait for and return the next item."""
+        if (item := await self._queue.get()) is _CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    async def consume(self, callback: Callable[[Any], None]) -> None:
+        """Deliver queued items to the callback until cancelled."""
+        while True:
+            callback(await self._queue.get())
+
+
+@dataclass
+class OwRadarStream:
+    """Object holding a stream subscriber of a client."""
+
+    channels: frozenset[str]
+    queue: OwRadarFrameQueue
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import random
 import socket
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -14,6 +15,17 @@ import backoff
 from cachetools import TTLCache
 from yarl import URL
 
+from .binary import BINARY_PROTOCOL, decode_frame
+from .breaker import OwRadarCircuitBreaker, host_breaker
+from .channels import (
+    OwRadarChannelStats,
+    OwRadarChannelWatchdog,
+    OwRadarFrame,
+    OwRadarFrameQueue,
+    OwRadarQueuePolicy,
+    OwRadarStream,
+)
+from .decoders import json_loads as default_json_loads
 from .exceptions import (
     OwRadarClosedConnectionError,
     OwRadarConnectionError,
@@ -21,28 +33,69 @@ from .exceptions import (
     OwRadarError,
     OwRadarTimeoutConnectionError,
 )
+from .hostqueue import OwRadarHostQueue, OwRadarRequestPriority, host_queue
 from .r60abd1_models import OwRadarR60abd1Device, OwRadarR60abd1Setting
+from .rtt import OwRadarRttEstimator
+from .schema import OwRadarModel
+from .subscriptions import OwRadarSubscriptions
+from .waves import OwRadarWaveBuffer
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Mapping
 
 VERSION_CACHE: TTLCache[str, str | None] = TTLCache(maxsize=16, ttl=7200)
 
+CHANNELS = ("state", "stats", "snap", "event")
+MULTIPLEX = "multiplex"
+# Channels whose frames are periodic; events only come when something happens
+WATCHED_CHANNELS = frozenset({"state", "stats", "snap", MULTIPLEX})
+
 
 @dataclass
 class OwRadarClient:
     """Main class for handling connections with device."""
 
     host: str
+    # Longest timeouts, the actual ones adapt to the round-trip time, see `rtt`;
+    # requests other than GET, e.g. settings, always get the full request_timeout
     request_timeout: float = 8.0
     session: aiohttp.client.ClientSession | None = None
+    # Fields added since are appended, keep the positions of the above
+    port: int = 80
+    connect_timeout: float = 5.0
+    channel_retries: int = 5
+    multiplex: bool = True
+    binary: bool = True
+    queue_size: int = 16
+    queue_policy: OwRadarQueuePolicy = OwRadarQueuePolicy.CONFLATE
+    json_loads: Callable[[bytes | str], Any] = default_json_loads
 
     _state_client: aiohttp.ClientWebSocketResponse | None = None
     _stats_client: aiohttp.ClientWebSocketResponse | None = None
     _snap_client: aiohttp.ClientWebSocketResponse | None = None
     _event_client: aiohttp.ClientWebSocketResponse | None = None
+    _multiplex_client: aiohttp.ClientWebSocketResponse | None = None
+    _multiplex_supported: bool | None = None
     _close_session: bool = False
+    _closing: bool = False
     _device: Any = None
+    _channel_stats: dict[str, OwRadarChannelStats] = field(default_factory=dict)
+    _watchdogs: dict[str, OwRadarChannelWatchdog] = field(default_factory=dict)
+    _streams: list[OwRadarStream] = field(default_factory=list)
+    _subscriptions: OwRadarSubscriptions = field(default_factory=OwRadarSubscriptions)
+    # Subscribed fields changed by frames, not dispatched to subscribers yet
+    _pending: set[str] = field(default_factory=set)
+    _listeners: int = 0
+    _stream_listener: asyncio.Task | None = None
+    _queue: OwRadarHostQueue | None = None
+    _breaker: OwRadarCircuitBreaker | None = None
+    _rtt: OwRadarRttEstimator = field(default_factory=OwRadarRttEstimator)
+    _waves: dict[str, OwRadarWaveBuffer] = field(
+        default_factory=lambda: {
+            "heart": OwRadarWaveBuffer(),
+            "breath": OwRadarWaveBuffer(),
+        }
+    )
 
     @property
     def state_connected(self) -> bool:
@@ -96,6 +149,19 @@ class OwRadarClient:
         """
         return self._event_client is not None and not self._event_client.closed
 
+    @property
+    def multiplex_connected(self) -> bool:
+        """
+        Return if we are connect to the multiplexed WebSocket of device.
+
+        Returns
+        -------
+            True if we are connected to the multiplexed WebSocket of device,
+            False otherwise.
+
+        """
+        return self._multiplex_client is not None and not self._multiplex_client.closed
+
     async def connect_client(self, url: URL) -> aiohttp.ClientWebSocketResponse:
         """
         Return if we are connect to the WebSocket of device.
@@ -110,7 +176,12 @@ class OwRadarClient:
             if self.session is None:
                 msg = "Error occurred for session empty"
                 raise OwRadarConnectionError(msg)
-            return await self.session.ws_connect(url=url, heartbeat=30)
+            started = time.monotonic()
+            client = await self.session.ws_connect(
+                url=url,
+                heartbeat=self._rtt.heartbeat,
+                protocols=(BINARY_PROTOCOL,) if self.binary else (),
+            )
         except (
             aiohttp.WSServerHandshakeError,
             aiohttp.ClientConnectionError,
@@ -121,6 +192,8 @@ class OwRadarClient:
                 f" on WebSocket at {self.host}"
             )
             raise OwRadarConnectionError(msg) from exception
+        self._rtt.sample(time.monotonic() - started)
+        return client
 
     async def state_connect(self) -> None:
         """
@@ -136,7 +209,7 @@ class OwRadarClient:
         """
         if self.state_connected:
             return
-        url = URL.build(scheme="ws", host=self.host, port=80, path="/ws/state")
+        url = URL.build(scheme="ws", host=self.host, port=self.port, path="/ws/state")
         self._state_client = await self.connect_client(url=url)
 
     async def stats_connect(self) -> None:
@@ -153,7 +226,7 @@ class OwRadarClient:
         """
         if self.stats_connected:
             return
-        url = URL.build(scheme="ws", host=self.host, port=80, path="/ws/stats")
+        url = URL.build(scheme="ws", host=self.host, port=self.port, path="/ws/stats")
         self._stats_client = await self.connect_client(url=url)
 
     async def snap_connect(self) -> None:
@@ -170,7 +243,7 @@ class OwRadarClient:
         """
         if self.snap_connected:
             return
-        url = URL.build(scheme="ws", host=self.host, port=80, path="/ws/snap")
+        url = URL.build(scheme="ws", host=self.host, port=self.port, path="/ws/snap")
         self._snap_client = await self.connect_client(url=url)
 
     async def event_connect(self) -> None:
@@ -187,29 +260,165 @@ class OwRadarClient:
         """
         if self.event_connected:
             return
-        url = URL.build(scheme="ws", host=self.host, port=80, path="/ws/event")
+        url = URL.build(scheme="ws", host=self.host, port=self.port, path="/ws/event")
         self._event_client = await self.connect_client(url=url)
 
+    async def multiplex_connect(self) -> None:
+        """
+        Connect to the multiplexed WebSocket of device.
+
+        A single socket at `/ws` is subscribed to every channel in `CHANNELS`;
+        the device then tags each frame with the channel it belongs to.
+
+        Raises
+        ------
+            OwRadarError: The configured device, does not support WebSocket
+                communications.
+            OwRadarConnectionError: Error occurred while communicating with
+                the device via the WebSocket.
+
+        """
+        if self.multiplex_connected:
+            return
+        url = URL.build(scheme="ws", host=self.host, port=self.port, path="/ws")
+        client = await self.connect_client(url=url)
+        try:
+            await client.send_json({"subscribe": list(CHANNELS)})
+        except (aiohttp.ClientError, ConnectionResetError) as exception:
+            await client.close()
+            msg = (
+                "Error occurred while subscribing to the multiplexed WebSocket"
+                f" of device at {self.host}"
+            )
+            raise OwRadarConnectionError(msg) from exception
+        self._multiplex_client = client
+
     async def listen_client(
-        self, client: aiohttp.ClientWebSocketResponse, callback: Callable[[Any], None]
+        self,
+        client: aiohttp.ClientWebSocketResponse,
+        callback: Callable[[Any], None],
+        receive: Callable[[Any], Any] | None = None,
+        channel: str = "",
     ) -> None:
-        """Listen for events on the WebSocket."""
-        while not client.closed:
-            message = await client.receive()
+        """
+        Listen for events on the WebSocket.
 
-            if message.type == aiohttp.WSMsgType.ERROR:
-                raise OwRadarConnectionError(client.exception())
+        Text frames are decoded with `json_loads`; aiohttp has already
+        decoded their payload to `str` at this point. Binary frames, only
+        sent once `BINARY_PROTOCOL` has been negotiated, are passed on as
+        `bytes`.
+
+        Every frame is handed to `receive` right away, which applies it to
+        the device and returns the channel it belongs to, or None to skip
+        it. The frame is then published to the matching `stream()`
+        subscribers and the device reaches `callback` through a bounded
+        queue, so a slow callback does not stall the socket;
+        `queue_policy` decides what happens once the queue is full. Field
+        subscribers run from the same consumer, just before `callback`,
+        with every field changed since they last ran.
+
+        Periodic channels are watched: once `misses` expected frames did not
+        arrive, see `OwRadarChannelWatchdog`, the socket is closed and the
+        channel reconnected rather than left half-open until the heartbeat
+        notices.
+
+        Args:
+        ----
+            client: The WebSocket to listen on.
+            callback: Method to call with every delivered item.
+            receive: Method applying a decoded frame, defaults to passing
+                the frame itself to `callback`.
+            channel: Name of the channel, used for its statistics.
+
+        Raises:
+        ------
+            OwRadarConnectionError: The connection failed, or went stale.
+            OwRadarClosedConnectionError: The device closed the connection.
 
-            if message.type == aiohttp.WSMsgType.TEXT:
-                callback(message.json())
+        """
+        stats = self._channel_stats.setdefault(channel, OwRadarChannelStats())
+        watchdog = None
+        if channel in WATCHED_CHANNELS:
+            watchdog = self._watchdogs.setdefault(channel, OwRadarChannelWatchdog())
+            watchdog.connected()
+        queue = OwRadarFrameQueue(self.queue_size, self.queue_policy, stats)
+
+        def deliver(item: Any) -> None:
+            if self._pending:
+                changes, self._pending = self._pending, set()
+                self._subscriptions.dispatch(self._device, changes)
+            callback(item)
+
+        consumer = asyncio.create_task(queue.consume(deliver))
+        try:
+            while not client.closed:
+                message = await self._receive(client, channel, watchdog, stats)
+
+                if message.type == aiohttp.WSMsgType.ERROR:
+                    raise OwRadarConnectionError(client.exception())
+
+                if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    if watchdog is not None:
+                        watchdog.frame(time.monotonic())
+                    if consumer.done():
+                        consumer.result()
+                    data = (
+                        self.json_loads(message.data)
+                        if message.type == aiohttp.WSMsgType.TEXT
+                        else message.data
+                    )
+                    if receive is None:
+                        item, applied = data, channel
+                    else:
+                        item, applied = self._device, receive(data)
+                    if applied is None:
+                        stats.skipped += 1
+                        continue
+                    if self._streams:
+                        await self._publish(applied, data)
+                    await queue.put(item)
+
+                if message.type in (
+                    aiohttp.WSMsgType.CLOSE,
+                    aiohttp.WSMsgType.CLOSED,
+                    aiohttp.WSMsgType.CLOSING,
+                ):
+                    msg = f"Connection to the WebSocket on {self.host} has been closed"
+                    raise OwRadarClosedConnectionError(msg)
+        finally:
+            consumer.cancel()
+
+    async def _receive(
+        self,
+        client: aiohttp.ClientWebSocketResponse,
+        channel: str,
+        watchdog: OwRadarChannelWatchdog | None,
+        stats: OwRadarChannelStats,
+    ) -> aiohttp.WSMessage:
+        """Receive the next message, closing the socket once it went stale."""
+        if watchdog is None:
+            return await client.receive()
+        timeout = watchdog.timeout(self._report_period(channel))
+        try:
+            return await client.receive(timeout)
+        except TimeoutError as exception:
+            stats.stale += 1
+            watchdog.expired()
+            await client.close()
+            msg = (
+                f"No frame on WebSocket `{channel}` of device at {self.host}"
+                f" for {timeout:.1f} s"
+            )
+            raise OwRadarConnectionError(msg) from exception
 
-            if message.type in (
-                aiohttp.WSMsgType.CLOSE,
-                aiohttp.WSMsgType.CLOSED,
-                aiohttp.WSMsgType.CLOSING,
-            ):
-                msg = f"Connection to the WebSocket on {self.host} has been closed"
-                raise OwRadarClosedConnectionError(msg)
+    def _report_period(self, channel: str) -> float | None:
+        """Return the period of a channel configured on the device, if any."""
+        if channel != "snap":
+            return None
+        setting = getattr(self._device, "setting", None)
+        # The snapshot report interval is set in minutes
+        interval = getattr(setting, "interval", 0)
+        return 60.0 * interval if interval else None
 
     async def state_listen(self, callback: Callable[[Any], None]) -> None:
         """
@@ -233,11 +442,10 @@ class OwRadarClient:
             msg = "Not connected to a WebSocket"
             raise OwRadarError(msg)
 
-        def receive(json_data: Any) -> None:
-            self._device.state.update_from_dict(json_data)
-            callback(self._device)
+        def receive(data: Any) -> str | None:
+            return self._apply("state", data)
 
-        await self.listen_client(self._state_client, receive)
+        await self.listen_client(self._state_client, callback, receive, "state")
 
     async def stats_listen(self, callback: Callable[[Any], None]) -> None:
         """
@@ -261,11 +469,10 @@ class OwRadarClient:
             msg = "Not connected to a WebSocket"
             raise OwRadarError(msg)
 
-        def receive(json_data: Any) -> None:
-            self._device.stats.update_from_dict(json_data)
-            callback(self._device)
+        def receive(data: Any) -> str | None:
+            return self._apply("stats", data)
 
-        await self.listen_client(self._stats_client, receive)
+        await self.listen_client(self._stats_client, callback, receive, "stats")
 
     async def snap_listen(self, callback: Callable[[Any], None]) -> None:
         """
@@ -289,11 +496,10 @@ class OwRadarClient:
             msg = "Not connected to a WebSocket"
             raise OwRadarError(msg)
 
-        def receive(json_data: Any) -> None:
-            self._device.snap.update_from_dict(json_data)
-            callback(self._device)
+        def receive(data: Any) -> str | None:
+            return self._apply("snap", data)
 
-        await self.listen_client(self._snap_client, receive)
+        await self.listen_client(self._snap_client, callback, receive, "snap")
 
     async def event_listen(self, callback: Callable[[Any], None]) -> None:
         """
@@ -317,11 +523,87 @@ class OwRadarClient:
             msg = "Not connected to a WebSocket"
             raise OwRadarError(msg)
 
-        def receive(json_data: Any) -> None:
-            self._device.event.update_from_dict(json_data)
-            callback(self._device)
+        def receive(data: Any) -> str | None:
+            return self._apply("event", data)
+
+        await self.listen_client(self._event_client, callback, receive, "event")
 
-        await self.listen_client(self._event_client, receive)
+    async def multiplex_listen(self, callback: Callable[[Any], None]) -> None:
+        """
+        Listen for events on the multiplexed WebSocket.
+
+        Every text frame is an object of the form `{"topic": "state",
+        "data": {...}}` and is routed to the model of the channel named by
+        `topic`. Binary frames carry their own record tag.
+
+        Args:
+        ----
+            callback: Method to call when an update is received from
+                the device.
+
+        Raises:
+        ------
+            OwRadarError: Not connected to a WebSocket.
+            OwRadarConnectionError: An connection error occurred while connected
+                to the device.
+            OwRadarConnectionClosedError: The WebSocket connection to the remote device
+                has been closed.
+
+        """
+        if (
+            not self._multiplex_client
+            or not self.multiplex_connected
+            or not self._device
+        ):
+            msg = "Not connected to a WebSocket"
+            raise OwRadarError(msg)
+
+        def receive(data: Any) -> str | None:
+            if isinstance(data, bytes):
+                return self._apply(None, data)
+            if isinstance(data, dict) and (topic := data.get("topic")) in CHANNELS:
+                return self._apply(topic, data.get("data", {}))
+            return None
+
+        await self.listen_client(self._multiplex_client, callback, receive, MULTIPLEX)
+
+    def _apply(self, channel: str | None, data: Any) -> str | None:
+        """
+        Apply a decoded JSON frame, or a binary frame, to the device.
+
+        The changes of subscribed fields (see `subscribe()`) are collected,
+        their subscribers run from the queue consumer of `listen_client()`.
+        Binary frames name their own channel; None is returned for those
+        skipped by `decode_frame`, and for JSON frames that are not an object.
+        """
+        if isinstance(data, bytes):
+            if (channel := decode_frame(self._device, data)) is None:
+                return None
+            changes = None
+        elif not isinstance(data, dict):
+            return None
+        else:
+            changes = getattr(self._device, channel).update_changes(data, f"{channel}.")
+        if channel == "state":
+            self._record_waves(data)
+        if self._subscriptions:
+            self._pending |= self._subscriptions.collect(self._device, channel, changes)
+        return channel
+
+    def _record_waves(self, data: Any) -> None:
+        """Append the wave samples of a state frame to the wave buffers."""
+        state = self._device.state
+        for name, buffer in self._waves.items():
+            # Binary state records always carry both waves
+            if isinstance(data, bytes) or "waves" in data.get(name, ()):
+                buffer.extend_waves(getattr(state, name).waves)
+
+    async def _publish(self, channel: str, data: Any) -> None:
+        """Publish a frame to the stream subscribers of its channel."""
+        frame = OwRadarFrame(channel, time.time(), data, getattr(self._device, channel))
+        for subscriber in self._streams:
+            if channel in subscriber.channels:
+                await subscriber.queue.put(frame)
 
     async def state_disconnect(self) -> None:
         """Disconnect from the WebSocket of device."""
@@ -351,26 +633,37 @@ class OwRadarClient:
 
         await self._event_client.close()
 
-    @backoff.on_exception(
-        backoff.expo, OwRadarConnectionError, max_tries=3, logger=None
-    )
+    async def multiplex_disconnect(self) -> None:
+        """Disconnect from the multiplexed WebSocket of device."""
+        if not self._multiplex_client or not self.multiplex_connected:
+            return
+
+        await self._multiplex_client.close()
+
     async def request(
         self,
         uri: str = "",
         method: str = "GET",
         data: dict[str, Any] | None = None,
+        priority: OwRadarRequestPriority | None = None,
     ) -> Any:
         """
         Handle a request to device.
 
         A generic method for sending/handling HTTP requests done against
-        the device.
+        the device. Requests wait for their turn in the queue of the device,
+        shared by every client of it; identical GETs waiting or in flight
+        share one response. Once the device failed to answer a few times in
+        a row, requests fail fast until it accepts connections again, see
+        `OwRadarCircuitBreaker`.
 
         Args:
         ----
             uri: Request URI, for example `/api/device`.
             method: HTTP method to use for the request.E.g., "GET" or "POST".
             data: Dictionary of data to send to the device.
+            priority: The priority of the request in the queue, by default
+                `SETTING` for writes and `POLL` for reads.
 
         Returns:
         -------
@@ -383,10 +676,53 @@ class OwRadarClient:
                 the device.
             OwRadarConnectionTimeoutError: A timeout occurred while communicating
                 with the device.
+            OwRadarCircuitOpenError: The device is unreachable, the request has
+                not been sent.
             OwRadarError: Received an unexpected response from the device.
 
         """
-        url = URL.build(scheme="http", host=self.host, port=80, path=uri)
+        if self._breaker is None:
+            self._breaker = host_breaker(self.host, self.port)
+        breaker = self._breaker
+        # Do not even queue requests while the device is known unreachable
+        breaker.check()
+        if priority is None:
+            priority = (
+                OwRadarRequestPriority.POLL
+                if method == "GET"
+                else OwRadarRequestPriority.SETTING
+            )
+        if self._queue is None:
+            self._queue = host_queue(self.host, self.port)
+
+        async def send() -> Any:
+            # The breaker may have opened while the request was queued
+            await breaker.acquire()
+            success = None
+            try:
+                response = await self._send(uri, method, data)
+            except OwRadarConnectionError:
+                success = False
+                raise
+            except OwRadarError:
+                # The device answered, with an error status
+                success = True
+                raise
+            else:
+                success = True
+                return response
+            finally:
+                breaker.record(success=success)
+
+        return await self._queue.run(
+            send,
+            priority,
+            (method, uri) if method == "GET" and data is None else None,
+        )
+
+    async def _send(self, uri: str, method: str, data: dict[str, Any] | None) -> Any:
+        """Send a request to device, see `request()`."""
+        url = URL.build(scheme="http", host=self.host, port=self.port, path=uri)
 
         headers = {
             "Accept": "*/*",
@@ -396,11 +732,21 @@ class OwRadarClient:
             self.session = aiohttp.ClientSession()
             self._close_session = True
 
+        # Only reads are quick enough to estimate the round-trip time from,
+        # the device answers a setting once applied
+        adaptive = method == "GET"
+        timeout = self.request_timeout
+        if adaptive:
+            timeout = self._rtt.timeout(timeout)
+
         try:
-            async with async_timeout.timeout(self.request_timeout):
+            started = time.monotonic()
+            async with async_timeout.timeout(timeout):
                 response = await self.session.request(
                     method, url, json=data, headers=headers
                 )
+            if adaptive:
+                self._rtt.sample(time.monotonic() - started)
 
             content_type = response.headers.get("Content-Type", "")
             if response.status // 100 in [4, 5]:
@@ -410,7 +756,7 @@ class OwRadarClient:
                 if content_type == "application/json":
                     raise OwRadarError(  # noqa: TRY301
                         response.status,
-                        json.loads(contents.decode("utf8")),
+                        self.json_loads(contents),
                     )
                 raise OwRadarError(  # noqa: TRY301
                     response.status,
@@ -418,11 +764,13 @@ class OwRadarClient:
                 )
 
             if "application/json" in content_type:
-                response_data = await response.json()
+                response_data = self.json_loads(await response.read())
             else:
                 response_data = await response.text()
 
         except TimeoutError as exception:
+            if adaptive:
+                self._rtt.backoff()
             msg = f"Timeout occurred while connecting to device at {self.host}"
             raise OwRadarTimeoutConnectionError(msg) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
@@ -437,7 +785,12 @@ class OwRadarClient:
         max_tries=3,
         logger=None,
     )
-    async def update(self, *, full_update: bool = False) -> Any:  # noqa: PLR0912
+    async def update(  # noqa: PLR0912
+        self,
+        *,
+        full_update: bool = False,
+        priority: OwRadarRequestPriority = OwRadarRequestPriority.POLL,
+    ) -> Any:
         """
         Get all information about the device in a single call.
 
@@ -447,6 +800,7 @@ class OwRadarClient:
         Args:
         ----
             full_update: Force a full update from the device.
+            priority: The priority of the request, see `request()`.
 
         Returns:
         -------
@@ -458,7 +812,8 @@ class OwRadarClient:
 
         """
         if self._device is None or full_update:
-            if not (data := await self.request("/api/device")):
+            data = await self.request("/api/device", priority=priority)
+            if not data:
                 msg = (
                     f"device at {self.host} returned an empty API response on full update",
                 )
@@ -478,7 +833,9 @@ class OwRadarClient:
             self._device = {}
             if radar_model == "r60abd1":
                 self._device = OwRadarR60abd1Device()
-            self._device.update_from_dict(data)
+            changes = self._device.update_changes(data)
+            if self._subscriptions:
+                self._subscriptions.notify(self._device, "", changes)
             return self._device
 
         return self._device
@@ -493,53 +850,353 @@ class OwRadarClient:
         """
         setting = {k: int(v) for k, v in data.items() if v is not None}
         message_data = await self.request("/api/device", method="POST", data=setting)
-        return self._device.update_from_dict(message_data)
+        changes = self._device.update_changes(message_data)
+        if self._subscriptions:
+            self._subscriptions.notify(self._device, "", changes)
+        return self._device
+
+    def subscribe(
+        self, callback: Callable[[Any, frozenset[str]], None], *paths: str
+    ) -> Callable[[], None]:
+        """
+        Subscribe to changes of specific device fields.
+
+        The callback only runs when one of the fields changed, instead of
+        on every frame, so e.g. a presence automation is not woken by
+        heart wave frames.
+
+        Args:
+        ----
+            callback: Method to call with the device and the set of
+                subscribed fields that changed.
+            paths: Dotted field paths, for example `state.body.presence`,
+                or `state.body` for each field of the body.
+
+        Returns:
+        -------
+            A function removing the subscription.
+
+        Raises:
+        ------
+            OwRadarError: No field, or a field that does not exist, was given.
+
+        """
+        # Before the first update, check the paths against the default model
+        model = (
+            type(self._device)
+            if isinstance(self._device, OwRadarModel)
+            else OwRadarR60abd1Device
+        )
+        return self._subscriptions.subscribe(callback, paths, self._device, model)
 
     @property
     def connected(self) -> bool:
         """
         Return if we are connect to the WebSocket of device.
 
+        Push only keeps every field of the device up to date with all of
+        its channels, so a device missing one still needs to be polled.
+
         Returns
         -------
-            True if we are connected to the WebSocket of device,
-            False otherwise.
+            True if the multiplexed socket, or the socket of every channel in
+            `CHANNELS`, is connected, False otherwise.
 
         """
-        return (
-            (self._state_client is not None and not self._state_client.closed)
-            and (self._stats_client is not None and not self._stats_client.closed)
-            and (self._snap_client is not None and not self._snap_client.closed)
-            and (self._event_client is not None and not self._event_client.closed)
+        if self.multiplex_connected:
+            return True
+        return all(getattr(self, f"{channel}_connected") for channel in CHANNELS)
+
+    @property
+    def waves(self) -> Mapping[str, OwRadarWaveBuffer]:
+        """
+        Return the heart and breath wave buffers.
+
+        Every state frame received on the WebSocket appends its wave
+        samples, see `OwRadarWaveBuffer.window()` to read them.
+
+        Returns
+        -------
+            The wave buffers, by name: `heart` and `breath`.
+
+        """
+        return self._waves
+
+    @property
+    def channels_connected(self) -> tuple[str, ...]:
+        """
+        Return the WebSocket channels of device we are connected to.
+
+        Returns
+        -------
+            The names of the connected channels, `MULTIPLEX` first followed
+            by the connected channels in `CHANNELS` order.
+
+        """
+        return tuple(
+            channel
+            for channel in (MULTIPLEX, *CHANNELS)
+            if getattr(self, f"{channel}_connected")
         )
 
+    @property
+    def rtt(self) -> OwRadarRttEstimator:
+        """
+        Return the round-trip time estimator of the device.
+
+        GET request and connect timeouts are derived from it, as well as the
+        heartbeat of the WebSockets opened afterwards.
+
+        Returns
+        -------
+            The estimator, updated by every answered GET request.
+
+        """
+        return self._rtt
+
+    @property
+    def channel_stats(self) -> Mapping[str, OwRadarChannelStats]:
+        """
+        Return supervision statistics of the WebSocket channels.
+
+        Returns
+        -------
+            Restart counts and uptime keyed by channel name.
+
+        """
+        return self._channel_stats
+
     async def listen(self, callback: Callable[[Any], None]) -> None:
-        """Listen for events."""
-        await asyncio.gather(
-            self.state_listen(callback),
-            self.stats_listen(callback),
-            self.snap_listen(callback),
-            self.event_listen(callback),
+        """
+        Listen for events on all connected channels.
+
+        Every channel runs under its own supervisor. A channel that drops is
+        reconnected on its own while the healthy channels keep running. A
+        channel that fails to reconnect `channel_retries` times in a row
+        ends the listener: every channel is stopped and its error raised, so
+        the caller can poll meanwhile and open the connection again.
+
+        Args:
+        ----
+            callback: Method to call when an update is received from
+                the device.
+
+        Raises:
+        ------
+            OwRadarError: Not connected to a WebSocket.
+            OwRadarConnectionError: A channel could not be reconnected.
+
+        """
+        active = self.channels_connected
+        if not active or not self._device:
+            msg = "Not connected to a WebSocket"
+            raise OwRadarError(msg)
+
+        self._listeners += 1
+        try:
+            async with asyncio.TaskGroup() as group:
+                for channel in active:
+                    group.create_task(
+                        self._channel_supervise(channel, callback),
+                        name=f"owradar-{self.host}-{channel}",
+                    )
+        except ExceptionGroup as error:
+            raise error.exceptions[0] from None
+        finally:
+            self._listeners -= 1
+
+    async def stream(
+        self,
+        *channels: str,
+        maxsize: int = 16,
+        policy: OwRadarQueuePolicy = OwRadarQueuePolicy.BLOCK,
+    ) -> AsyncIterator[OwRadarFrame]:
+        """
+        Stream frames received from the device.
+
+        Any number of streams can be open on one connection, each only
+        receives the channels it asked for. With the default `BLOCK`
+        policy a stream that is not consumed fast enough pushes back on
+        the socket; `DROP_OLDEST` and `CONFLATE` shed frames instead.
+
+        When nothing is listening yet, the stream opens the connection and
+        listens for as long as it is iterated, ending when the connection
+        is lost. The connection is closed again once the last such stream
+        is done. Close the stream with `contextlib.aclosing` to stop
+        promptly when breaking out of the loop.
+
+        Args:
+        ----
+            channels: Channels to receive, all of `CHANNELS` when empty.
+            maxsize: Number of frames buffered for this stream.
+            policy: What to do with new frames while the buffer is full.
+
+        Yields:
+        ------
+            Received frames, in order.
+
+        Raises:
+        ------
+            OwRadarError: An unknown channel was requested.
+            OwRadarConnectionError: The connection to the device was lost.
+
+        """
+        if unknown := set(channels) - set(CHANNELS):
+            msg = f"Unknown channels {sorted(unknown)}"
+            raise OwRadarError(msg)
+        subscriber = OwRadarStream(
+            frozenset(channels or CHANNELS),
+            OwRadarFrameQueue(maxsize, policy, OwRadarChannelStats()),
         )
+        self._streams.append(subscriber)
+        if self._stream_listener is None and not self._listeners:
+            self._stream_listener = asyncio.create_task(self._stream_listen())
+        listener = self._stream_listener
+
+        def stop(_: asyncio.Task) -> None:
+            subscriber.queue.close()
+
+        if listener is not None:
+            listener.add_done_callback(stop)
+        try:
+            async for frame in subscriber.queue:
+                yield frame
+            if listener is not None:
+                listener.result()
+        finally:
+            self._streams.remove(subscriber)
+            if listener is not None:
+                listener.remove_done_callback(stop)
+                if listener.done() or not self._streams:
+                    listener.cancel()
+                    self._stream_listener = None
+                    await asyncio.wait((listener,))
+
+    async def _stream_listen(self) -> None:
+        """Open the connection and listen on behalf of the streams."""
+        opened = not self.channels_connected
+        try:
+            if opened:
+                await self.open()
+            await self.listen(lambda _: None)
+        finally:
+            # Only close what the streams opened themselves
+            if opened:
+                await self.close()
+
+    async def _channel_supervise(
+        self, channel: str, callback: Callable[[Any], None]
+    ) -> None:
+        """Keep a single channel listening, reconnecting it when it drops."""
+        stats = self._channel_stats.setdefault(channel, OwRadarChannelStats())
+        listen = getattr(self, f"{channel}_listen")
+        disconnect = getattr(self, f"{channel}_disconnect")
+        while not self._closing:
+            try:
+                await self.channel_connect(channel)
+                stats.mark_connected()
+                await listen(callback)
+            except OwRadarConnectionError:
+                stats.mark_disconnected()
+                await disconnect()
+                if self._closing:
+                    return
+                if stats.failures > self.channel_retries:
+                    raise
+                stats.restarts += 1
+                delay = min(30.0, 2.0 ** (stats.failures - 1))
+                await asyncio.sleep(random.uniform(delay / 2, delay))  # noqa: S311
+            else:
+                stats.connected_at = None
+                return
+
+    async def channel_connect(self, channel: str) -> None:
+        """
+        Connect a single WebSocket channel of device, bounded by a timeout.
+
+        Args:
+        ----
+            channel: One of `CHANNELS`, or `MULTIPLEX`.
+
+        Raises:
+        ------
+            OwRadarConnectionError: Error occurred while communicating with
+                the device via the WebSocket.
+            OwRadarTimeoutConnectionError: The channel did not connect within
+                its timeout, adapted to the round-trip time up to
+                `connect_timeout`.
+
+        """
+        try:
+            async with async_timeout.timeout(self._rtt.timeout(self.connect_timeout)):
+                await getattr(self, f"{channel}_connect")()
+        except TimeoutError as exception:
+            self._rtt.backoff()
+            msg = (
+                f"Timeout occurred while connecting to WebSocket `{channel}`"
+                f" of device at {self.host}"
+            )
+            raise OwRadarTimeoutConnectionError(msg) from exception
 
     async def open(self) -> None:
-        """Open client (WebSocket) session."""
+        """
+        Open client (WebSocket) session.
+
+        With `multiplex` set, a single socket subscribed to every channel is
+        tried first. Devices that refuse it fall back to one socket per
+        channel, connected concurrently; a channel that fails to connect is
+        left out, so the remaining channels still deliver data while the
+        device is also polled, see `connected`.
+
+        Raises
+        ------
+            OwRadarError: The device does not support WebSockets.
+            OwRadarConnectionError: None of the channels could be connected.
+
+        """
         if not self._device:
             await self.update()
         if not self.session or not self._device:
-            msg = "The device at {self.host} does not support WebSockets"
+            msg = f"The device at {self.host} does not support WebSockets"
             raise OwRadarError(msg)
-        await self.state_connect()
-        await self.stats_connect()
-        await self.snap_connect()
-        await self.event_connect()
+        self._closing = False
+        if self.multiplex and self._multiplex_supported is not False:
+            try:
+                await self.channel_connect(MULTIPLEX)
+            except OwRadarConnectionError as error:
+                # Devices without the multiplexed endpoint refuse the handshake,
+                # remember it and stick to one socket per channel.
+                if isinstance(error.__cause__, aiohttp.WSServerHandshakeError):
+                    self._multiplex_supported = False
+            else:
+                self._multiplex_supported = True
+                return
+
+        results = await asyncio.gather(
+            *(self.channel_connect(channel) for channel in CHANNELS),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            if not isinstance(error, OwRadarError):
+                raise error
+        if len(errors) == len(CHANNELS):
+            msg = (
+                "Error occurred while connecting to the WebSockets"
+                f" of device at {self.host}"
+            )
+            raise OwRadarConnectionError(msg) from errors[0]
 
     async def close(self) -> None:
         """Close opened client (WebSocket) session."""
-        await self.state_disconnect()
-        await self.stats_disconnect()
-        await self.snap_disconnect()
-        await self.event_disconnect()
+        self._closing = True
+        await asyncio.gather(
+            self.multiplex_disconnect(),
+            self.state_disconnect(),
+            self.stats_disconnect(),
+            self.snap_disconnect(),
+            self.event_disconnect(),
+        )
         if self.session and self._close_session:
             await self.session.close()
 
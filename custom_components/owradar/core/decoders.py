@@ -0,0 +1,41 @@
+"""Frame decoders for OwRadar."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    JsonLoads = Callable[[bytes | str], Any]
+
+
+def fastest_json_loads() -> JsonLoads:
+    """
+    Return the fastest available JSON decoder.
+
+    orjson is preferred, then msgspec, then the standard library. All of them
+    decode straight from `bytes`, without an intermediate `str`.
+
+    Returns
+    -------
+        A function decoding a JSON document from `bytes` or `str`.
+
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return orjson.loads
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        return msgspec.json.decode
+    return json.loads
+
+
+json_loads = fastest_json_loads()
@@ -5,7 +5,7 @@ class OwRadarError(Exception):
     """Generic OwRadar exception."""
 
 
-class OwRadarEmptyResponseError(Exception):
+class OwRadarEmptyResponseError(OwRadarError):
     """OwRadar empty API response exception."""
 
 
@@ -17,6 +17,10 @@ class OwRadarTimeoutConnectionError(OwRadarConnectionError):
     """OwRadar connection Timeout exception."""
 
 
+class OwRadarCircuitOpenError(OwRadarConnectionError):
+    """OwRadar device unreachable, request not sent exception."""
+
+
 class OwRadarClosedConnectionError(OwRadarConnectionError):
     """OwRadar WebSocket connection has been closed."""
 
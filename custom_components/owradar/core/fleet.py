@@ -0,0 +1,351 @@
+"""Fleet management for many OwRadar devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .client import OwRadarClient
+from .exceptions import OwRadarError
+from .latency import OwRadarLatencyStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Successive phases are spread by the golden ratio, so devices added one by
+# one stay evenly spaced over the interval without reshuffling.
+_PHASE_STEP = (math.sqrt(5) - 1) / 2
+
+
+@dataclass
+class OwRadarFleetStats(OwRadarLatencyStats):
+    """Counters and latency of the requests of a fleet."""
+
+    # The latency of a poll runs from its scheduled time to its response,
+    # including the wait for a free slot
+    latency_window = 64
+
+    polls: int = 0
+    poll_failures: int = 0
+    opens: int = 0
+    open_failures: int = 0
+    # Scheduled polls skipped because push was healthy
+    skipped: int = 0
+    in_flight: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        """Return the share of successful polls, 1 before the first poll."""
+        if not self.polls:
+            return 1.0
+        return 1 - self.poll_failures / self.polls
+
+    def record(self, latency: float, *, success: bool) -> None:
+        """Record a completed poll."""
+        self.polls += 1
+        if not success:
+            self.poll_failures += 1
+            return
+        self.record_latency(latency)
+
+
+@dataclass
+class OwRadarFleet:
+    """Shared session, poll scheduling and listener supervision of devices."""
+
+    poll_interval: float = 10.0
+    max_concurrency: int = 16
+    # Idle connections are kept across polls, longer than poll_interval
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    reconnect_min_delay: float = 1.0
+    reconnect_max_delay: float = 60.0
+    stats: OwRadarFleetStats = field(default_factory=OwRadarFleetStats)
+
+    _session: aiohttp.ClientSession | None = None
+    _semaphore: asyncio.Semaphore | None = None
+    # Clients and their running tasks, by host and port
+    _clients: dict[str, OwRadarClient] = field(default_factory=dict)
+    _tasks: dict[str, list[asyncio.Task]] = field(default_factory=dict)
+    _phases: int = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Return the session shared by the clients, creating it if needed.
+
+        WebSockets hold their connection for as long as they are open, so
+        the connector itself is not limited; requests are bounded by
+        `max_concurrency` instead.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+            )
+        return self._session
+
+    @property
+    def clients(self) -> tuple[OwRadarClient, ...]:
+        """Return the clients of the fleet."""
+        return tuple(self._clients.values())
+
+    @property
+    def listening(self) -> int:
+        """Return the number of devices with a connected WebSocket."""
+        return sum(client.connected for client in self._clients.values())
+
+    def add(self, host: str, **kwargs: Any) -> OwRadarClient:
+        """
+        Create the client of a device, using the shared session.
+
+        Args:
+        ----
+            host: The host of the device.
+            kwargs: Further `OwRadarClient` arguments.
+
+        Returns:
+        -------
+            The client.
+
+        Raises:
+        ------
+            OwRadarError: The device is already part of the fleet.
+
+        """
+        client = OwRadarClient(host, session=self.session, **kwargs)
+        key = _key(client)
+        if key in self._clients:
+            msg = f"Device at {key} is already part of the fleet"
+            raise OwRadarError(msg)
+        self._clients[key] = client
+        self._tasks[key] = []
+        return client
+
+    async def remove(self, client: OwRadarClient) -> None:
+        """
+        Stop the polls and listener of a client and close it.
+
+        The shared session is closed along with the last client.
+        """
+        key = _key(client)
+        if self._clients.get(key) is not client:
+            return
+        tasks = self._tasks.pop(key)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await client.close()
+        del self._clients[key]
+        if not self._clients:
+            await self.close()
+
+    async def poll(self, client: OwRadarClient, *, full_update: bool = True) -> Any:
+        """
+        Update a device, waiting for a free slot of the fleet.
+
+        Args:
+        ----
+            client: A client of the fleet.
+            full_update: Force a full update from the device.
+
+        Returns:
+        -------
+            The device data.
+
+        Raises:
+        ------
+            OwRadarError: The device could not be updated.
+            OwRadarEmptyResponseError: The device returned an empty response.
+
+        """
+        return await self._poll(client, time.monotonic(), full_update=full_update)
+
+    async def _poll(
+        self, client: OwRadarClient, scheduled: float, *, full_update: bool
+    ) -> Any:
+        """Update a device, measuring the latency from its scheduled time."""
+        async with self._slots():
+            self.stats.in_flight += 1
+            try:
+                device = await client.update(full_update=full_update)
+            except OwRadarError:
+                self.stats.record(time.monotonic() - scheduled, success=False)
+                raise
+            finally:
+                self.stats.in_flight -= 1
+        self.stats.record(time.monotonic() - scheduled, success=True)
+        return device
+
+    def schedule(
+        self,
+        client: OwRadarClient,
+        callback: Callable[[Any, Exception | None], None],
+    ) -> Callable[[], None]:
+        """
+        Poll a device every `poll_interval`, at its own phase.
+
+        Polls are skipped while the WebSocket of the device is connected,
+        push keeps it up to date.
+
+        Args:
+        ----
+            client: A client of the fleet.
+            callback: Method to call with the device data, or None and the
+                error of a failed poll.
+
+        Returns:
+        -------
+            A function stopping the polls.
+
+        """
+        phase = (self._phases * _PHASE_STEP) % 1 * self.poll_interval
+        self._phases += 1
+        return self._start(
+            client,
+            self._schedule(client, callback, phase),
+            f"owradar-{client.host}-poll",
+        )
+
+    async def _schedule(
+        self,
+        client: OwRadarClient,
+        callback: Callable[[Any, Exception | None], None],
+        phase: float,
+    ) -> None:
+        """Poll a device at its phase of every interval."""
+        interval = self.poll_interval
+        now = time.monotonic()
+        deadline = now - now % interval + phase
+        while True:
+            # Slots missed by a slow poll are skipped rather than bunched
+            while deadline <= time.monotonic():
+                deadline += interval
+            await asyncio.sleep(deadline - time.monotonic())
+            if client.connected:
+                self.stats.skipped += 1
+                continue
+            try:
+                device = await self._poll(client, deadline, full_update=True)
+            except OwRadarError as error:
+                callback(None, error)
+            else:
+                callback(device, None)
+
+    def supervise(
+        self,
+        client: OwRadarClient,
+        callback: Callable[[Any], None],
+        on_push: Callable[..., None],
+    ) -> Callable[[], None]:
+        """
+        Keep the WebSocket listener of a device running.
+
+        The connection is reopened with jittered exponential backoff once
+        it is lost; opening it takes a slot of the fleet, so hundreds of
+        devices coming back at once do not reconnect all together.
+
+        Args:
+        ----
+            client: A client of the fleet.
+            callback: Method to call when an update is received from the
+                device.
+            on_push: Method to call with `active=True` once push is
+                active, with `active=False` and the `error`, if any, once it
+                is not. Errors other than `OwRadarError` are logged, and the
+                listener restarted all the same.
+
+        Returns:
+        -------
+            A function stopping the listener.
+
+        """
+        return self._start(
+            client,
+            self._supervise(client, callback, on_push),
+            f"owradar-{client.host}-listen",
+        )
+
+    async def _supervise(
+        self,
+        client: OwRadarClient,
+        callback: Callable[[Any], None],
+        on_push: Callable[..., None],
+    ) -> None:
+        """Open and listen to the WebSocket of a device, reconnecting it."""
+        attempt = 0
+        while True:
+            error: Exception | None = None
+            try:
+                async with self._slots():
+                    self.stats.opens += 1
+                    await client.open()
+            except Exception as err:
+                self.stats.open_failures += 1
+                error = err
+                if not isinstance(err, OwRadarError):
+                    _LOGGER.exception("Unexpected error opening %s", client.host)
+            else:
+                attempt = 0
+                on_push(active=True, error=None)
+                try:
+                    await client.listen(callback=callback)
+                except Exception as err:
+                    error = err
+                    if not isinstance(err, OwRadarError):
+                        # e.g. a failing callback, keep the listener running
+                        _LOGGER.exception(
+                            "Unexpected error listening to %s", client.host
+                        )
+
+            # Ensure we are disconnected, the device is polled meanwhile
+            await client.close()
+            on_push(active=False, error=error)
+
+            delay = min(self.reconnect_max_delay, self.reconnect_min_delay * 2**attempt)
+            attempt += 1
+            await asyncio.sleep(random.uniform(delay / 2, delay))  # noqa: S311
+
+    def _start(self, client: OwRadarClient, coro: Any, name: str) -> Callable[[], None]:
+        """Run a task of a client until the returned function is called."""
+        key = _key(client)
+        if self._clients.get(key) is not client:
+            coro.close()
+            msg = f"Device at {key} is not part of the fleet"
+            raise OwRadarError(msg)
+        task = asyncio.create_task(coro, name=name)
+        tasks = self._tasks[key]
+        tasks.append(task)
+        task.add_done_callback(lambda _: tasks.remove(task) if task in tasks else None)
+        return task.cancel
+
+    def _slots(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding the requests of the fleet."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Stop every poll and listener, close the clients and the session."""
+        for client in list(self._clients.values()):
+            await self.remove(client)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def _key(client: OwRadarClient) -> str:
+    """Return the key of a client in the fleet."""
+    return f"{client.host}:{client.port}"
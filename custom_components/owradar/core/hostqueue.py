@@ -0,0 +1,151 @@
+"""
+Per-device request queue for OwRadar.
+
+The firmware of the devices only serves a few HTTP requests at once; more
+and they time out. Every client of a device, e.g. the coordinator and a
+config flow probe, shares the queue of its host, which sends one request
+at a time, settings first. Identical GETs waiting or in flight are sent
+once, their callers share the response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .hosts import OwRadarHostRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+_T = TypeVar("_T")
+
+
+class OwRadarRequestPriority(IntEnum):
+    """Enumeration representing the priority of a request, lowest first."""
+
+    SETTING = 0
+    PROBE = 1
+    POLL = 2
+
+
+class OwRadarHostQueue:
+    """Serialize and prioritize the requests sent to a device."""
+
+    def __init__(self, concurrency: int = 1) -> None:
+        """
+        Initialize.
+
+        Args:
+        ----
+            concurrency: The number of requests sent to the device at once.
+
+        """
+        self.concurrency = concurrency
+        self.active = 0
+        self.deduplicated = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._shared: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of requests waiting for their turn."""
+        return sum(not waiter.done() for _, _, waiter in self._waiters)
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[_T]],
+        priority: OwRadarRequestPriority,
+        key: Hashable | None = None,
+    ) -> _T:
+        """
+        Send a request once its turn has come.
+
+        Args:
+        ----
+            send: Function sending the request.
+            priority: The priority of the request.
+            key: Identifies requests with the same response, e.g. GETs of the
+                same URI; callers of a request waiting or in flight with the
+                same key share its response instead of sending another.
+
+        Returns:
+        -------
+            The response.
+
+        """
+        if key is None:
+            return await self._run(send, priority)
+        while (shared := self._shared.get(key)) is not None:
+            self.deduplicated += 1
+            try:
+                return await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                # The caller sending the request was cancelled, not this one:
+                # send it again.
+                task = asyncio.current_task()
+                if not shared.cancelled() or (task and task.cancelling()):
+                    raise
+
+        shared = self._shared[key] = asyncio.get_running_loop().create_future()
+        # Nobody may share the response, do not warn about its exception
+        shared.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            result = await self._run(send, priority)
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except BaseException as error:
+            shared.set_exception(error)
+            raise
+        else:
+            shared.set_result(result)
+            return result
+        finally:
+            del self._shared[key]
+
+    async def _run(
+        self, send: Callable[[], Awaitable[_T]], priority: OwRadarRequestPriority
+    ) -> _T:
+        """Send a request once a slot is free."""
+        await self._acquire(priority)
+        try:
+            return await send()
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: OwRadarRequestPriority) -> None:
+        """Wait for a slot, by priority then arrival."""
+        if self.active < self.concurrency and not self.waiting:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over meanwhile, pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot over to the next waiting request, or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+_QUEUES = OwRadarHostRegistry(lambda _host, _port: OwRadarHostQueue())
+
+
+def host_queue(host: str, port: int) -> OwRadarHostQueue:
+    """Return the request queue of a device."""
+    return _QUEUES.get(host, port)
@@ -0,0 +1,34 @@
+"""Registries of the objects shared by the clients of an OwRadar device."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
+
+
+class OwRadarHostRegistry(Generic[_T]):
+    """Objects by host and port, shared by every client of a device while in use."""
+
+    def __init__(self, factory: Callable[[str, int], _T]) -> None:
+        """
+        Initialize.
+
+        Args:
+        ----
+            factory: Creates the object of a device from its host and port.
+
+        """
+        self._factory = factory
+        self._objects: WeakValueDictionary[str, _T] = WeakValueDictionary()
+
+    def get(self, host: str, port: int) -> _T:
+        """Return the object of a device, created on first use."""
+        key = f"{host}:{port}"
+        if (item := self._objects.get(key)) is None:
+            item = self._objects[key] = self._factory(host, port)
+        return item
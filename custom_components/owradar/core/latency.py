@@ -0,0 +1,32 @@
+"""Latency statistics of the OwRadar pools."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+
+@dataclass(kw_only=True)
+class OwRadarLatencyStats:
+    """
+    Latency of completed operations, in seconds.
+
+    The mean is a running mean over the first `latency_window` operations,
+    then exponentially weighted with the same weight.
+    """
+
+    latency_window: ClassVar[int] = 16
+
+    last_latency: float = 0.0
+    mean_latency: float = 0.0
+    max_latency: float = 0.0
+    _latencies: int = field(default=0, repr=False)
+
+    def record_latency(self, latency: float) -> None:
+        """Record the latency of a completed operation."""
+        self._latencies += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.mean_latency += (latency - self.mean_latency) / min(
+            self._latencies, self.latency_window
+        )
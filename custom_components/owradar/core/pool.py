@@ -0,0 +1,189 @@
+"""Process pool offload for OwRadar waveform DSP."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .dsp import WAVE_SAMPLE_RATE, OwRadarRateEstimates, estimate_rates
+from .latency import OwRadarLatencyStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shared memory blocks mapped by this worker process, by name, oldest first
+_ATTACHED: dict[str, shared_memory.SharedMemory] = {}
+# Blocks kept mapped by a worker; older ones have been replaced by the pool
+_ATTACHED_MAX = 8
+
+
+def _estimate_shared(
+    name: str, shape: tuple[int, int], band: tuple[float, float], sample_rate: float
+) -> OwRadarRateEstimates:
+    """Estimate the rates of a batch held in shared memory, in a worker."""
+    if (block := _ATTACHED.get(name)) is None:
+        # Workers share the resource tracker of the pool owner, which
+        # unlinks the block, so attaching here does not leak it.
+        block = _ATTACHED[name] = shared_memory.SharedMemory(name=name)
+        if len(_ATTACHED) > _ATTACHED_MAX:
+            _ATTACHED.pop(next(iter(_ATTACHED))).close()
+    windows = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+    return estimate_rates(windows, band, sample_rate)
+
+
+@dataclass
+class OwRadarDspStats(OwRadarLatencyStats):
+    """Counters and latency of a DSP pool, from submission to result."""
+
+    submitted: int = 0
+    completed: int = 0
+    dropped: int = 0
+    # Times the workers were replaced after one died
+    restarts: int = 0
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed batch."""
+        self.completed += 1
+        self.record_latency(latency)
+
+
+@dataclass
+class _OwRadarDspSlot:
+    """A shared memory block for one batch in flight."""
+
+    block: shared_memory.SharedMemory
+
+    @classmethod
+    def create(cls, size: int) -> _OwRadarDspSlot:
+        """Create a slot of at least size bytes."""
+        return cls(shared_memory.SharedMemory(create=True, size=max(size, 1)))
+
+    def close(self) -> None:
+        """Release the shared memory block."""
+        self.block.close()
+        self.block.unlink()
+
+
+@dataclass
+class OwRadarDspPool:
+    """Worker processes running the waveform DSP out of the event loop."""
+
+    workers: int = 1
+    max_in_flight: int = 2
+    stats: OwRadarDspStats = field(default_factory=OwRadarDspStats)
+
+    _executor: ProcessPoolExecutor | None = None
+    _free: list[_OwRadarDspSlot] = field(default_factory=list)
+    _slots: list[_OwRadarDspSlot] = field(default_factory=list)
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of batches being processed."""
+        return len(self._slots) - len(self._free)
+
+    async def estimate(
+        self,
+        windows: np.ndarray,
+        band: tuple[float, float],
+        sample_rate: float = WAVE_SAMPLE_RATE,
+    ) -> OwRadarRateEstimates | None:
+        """
+        Estimate the rates of a batch of wave windows in a worker.
+
+        Args:
+        ----
+            windows: One window per row, oldest sample first.
+            band: The lowest and highest plausible frequency, in Hz.
+            sample_rate: The sample rate of the windows, in Hz.
+
+        Returns:
+        -------
+            The estimates, or None when the batch has been dropped because
+            the pool is not started, `max_in_flight` batches are already
+            being processed, or a worker died.
+
+        """
+        started = time.monotonic()
+        self.stats.submitted += 1
+        executor = self._executor
+        if executor is None or (slot := self._acquire(windows.nbytes)) is None:
+            self.stats.dropped += 1
+            return None
+        try:
+            shared = np.ndarray(windows.shape, dtype=np.float64, buffer=slot.block.buf)
+            shared[:] = windows
+            del shared
+            estimates = await asyncio.get_running_loop().run_in_executor(
+                executor,
+                _estimate_shared,
+                slot.block.name,
+                windows.shape,
+                band,
+                sample_rate,
+            )
+        except BrokenProcessPool:
+            self._restart(executor)
+            self.stats.dropped += 1
+            return None
+        finally:
+            # The pool may have been shut down meanwhile
+            if slot in self._slots:
+                self._free.append(slot)
+        self.stats.record(time.monotonic() - started)
+        return estimates
+
+    def _acquire(self, size: int) -> _OwRadarDspSlot | None:
+        """Take a free slot of at least size bytes, None if all are busy."""
+        if self._free:
+            slot = self._free.pop()
+            if slot.block.size >= size:
+                return slot
+            self._slots.remove(slot)
+            slot.close()
+        elif len(self._slots) >= self.max_in_flight:
+            return None
+        # Leave room for the fleet to grow before reallocating
+        slot = _OwRadarDspSlot.create(size * 2)
+        self._slots.append(slot)
+        return slot
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replace the workers after one died, once per broken executor."""
+        if self._executor is not broken:
+            return
+        _LOGGER.warning("A DSP worker died, restarting the workers")
+        self.stats.restarts += 1
+        # Without waiting: the workers left are stopped by the executor, and
+        # new ones are spawned on the next batch.
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._release()
+        self.start()
+
+    def start(self) -> None:
+        """Start the workers, blocking."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def shutdown(self) -> None:
+        """Stop the workers and release the shared memory, blocking."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._release()
+
+    def _release(self) -> None:
+        """Release the shared memory of every slot."""
+        for slot in self._slots:
+            slot.close()
+        self._slots.clear()
+        self._free.clear()
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import IntEnum
-from typing import Any
 
 from .common_models import (
     OwRadarCommonDevice,
@@ -12,33 +10,20 @@ from .common_models import (
     OwRadarCommonSettingSwitch,
     OwRadarCommonState,
 )
+from .schema import OwRadarIntEnum, OwRadarModel, compile_model
 
 
-@dataclass
-class OwRadarR60abd1Event:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1Event(OwRadarModel):
     """Object holding body location state in OwRadar."""
 
     status: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Event:
-        """
-        Return Body Location object form OwRadar API response.
 
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.status = data.get("status", self.status)
-        return self
-
-
-@dataclass
-class OwRadarR60abd1Snap:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1Snap(OwRadarModel):
     """Object holding body location state in OwRadar."""
 
     body_range: int = 0
@@ -52,34 +37,10 @@ class OwRadarR60abd1Snap:
     breath_rate: int = 0
     sleep_away: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Snap:
-        """
-        Return Body Location object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.body_range = data.get("body_range", self.body_range)
-        self.body_presence = data.get("body_presence", self.body_presence)
-        self.body_energy = data.get("body_energy", self.body_energy)
-        self.body_movement = data.get("body_movement", self.body_movement)
-        self.body_distance = data.get("body_distance", self.body_distance)
-        self.body_location_x = data.get("body_location_x", self.body_location_x)
-        self.body_location_y = data.get("body_location_y", self.body_location_y)
-        self.heart_rate = data.get("heart_rate", self.heart_rate)
-        self.breath_rate = data.get("breath_rate", self.breath_rate)
-        self.sleep_away = data.get("sleep_away", self.sleep_away)
-        return self
-
-
-@dataclass
-class OwRadarR60abd1Stats:
+
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1Stats(OwRadarModel):
     """Object holding body location state in OwRadar."""
 
     status: int = 0
@@ -87,41 +48,22 @@ class OwRadarR60abd1Stats:
     heart: int = 0
     turn: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Stats:
-        """
-        Return Body Location object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
 
-        """
-        self.status = data.get("status", self.status)
-        self.breath = data.get("breath", self.breath)
-        self.heart = data.get("heart", self.heart)
-        self.turn = data.get("turn", self.turn)
-        return self
-
-
-class OwRadarR60abd1StateBodyRange(IntEnum):
+class OwRadarR60abd1StateBodyRange(OwRadarIntEnum):
     """Enumeration representing body range from OwRadar."""
 
     OUT = 0
     IN = 1
 
 
-class OwRadarR60abd1StateBodyPresence(IntEnum):
+class OwRadarR60abd1StateBodyPresence(OwRadarIntEnum):
     """Enumeration representing body presence from OwRadar."""
 
     NOBODY = 0
     SOMEBODY = 1
 
 
-class OwRadarR60abd1StateBodyMovement(IntEnum):
+class OwRadarR60abd1StateBodyMovement(OwRadarIntEnum):
     """Enumeration representing body movement from OwRadar."""
 
     NONE = 0
@@ -129,35 +71,19 @@ class OwRadarR60abd1StateBodyMovement(IntEnum):
     ACTIVE = 2
 
 
-@dataclass
-class OwRadarR60abd1StateBodyLocation:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateBodyLocation(OwRadarModel):
     """Object holding body location state in OwRadar."""
 
     x: int = 0
     y: int = 0
     z: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateBodyLocation:
-        """
-        Return Body Location object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body Location object.
-
-        """
-        self.x = data.get("x", self.x)
-        self.y = data.get("y", self.y)
-        self.z = data.get("z", self.z)
-        return self
-
 
-@dataclass
-class OwRadarR60abd1StateBody:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateBody(OwRadarModel):
     """Object holding body state in OwRadar."""
 
     range: OwRadarR60abd1StateBodyRange = OwRadarR60abd1StateBodyRange.OUT
@@ -169,37 +95,10 @@ class OwRadarR60abd1StateBody:
         default_factory=OwRadarR60abd1StateBodyLocation
     )
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateBody:
-        """
-        Update and Return Body object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Body object.
-
-        """
-        self.range = OwRadarR60abd1StateBodyRange(data.get("range", self.range.value))
-        self.presence = OwRadarR60abd1StateBodyPresence(
-            data.get("presence", self.presence.value)
-        )
-        self.energy = data.get("energy", self.energy)
-        self.movement = OwRadarR60abd1StateBodyMovement(
-            data.get("movement", self.movement.value)
-        )
-        self.distance = data.get("distance", self.distance)
-        self.location = self.location.update_from_dict(
-            data.get("location", self.location.__dict__)
-        )
-
-        return self
-
-
-@dataclass
-class OwRadarR60abd1StateWaves:
+
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateWaves(OwRadarModel):
     """Object holding wave state in OwRadar."""
 
     w0: int = 0
@@ -208,55 +107,17 @@ class OwRadarR60abd1StateWaves:
     w3: int = 0
     w4: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateWaves:
-        """
-        Update and Return Heart object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Heart object.
-
-        """
-        self.w0 = data.get("w0", self.w0)
-        self.w1 = data.get("w1", self.w1)
-        self.w2 = data.get("w2", self.w2)
-        self.w3 = data.get("w3", self.w3)
-        self.w4 = data.get("w4", self.w4)
-
-        return self
-
 
-@dataclass
-class OwRadarR60abd1StateHeart:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateHeart(OwRadarModel):
     """Object holding heart state in OwRadar."""
 
     rate: int = 0
     waves: OwRadarR60abd1StateWaves = field(default_factory=OwRadarR60abd1StateWaves)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateHeart:
-        """
-        Update and Return Heart object form OwRadar API response.
 
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Heart object.
-
-        """
-        self.rate = data.get("rate", self.rate)
-        self.waves = self.waves.update_from_dict(data.get("waves", self.waves.__dict__))
-
-        return self
-
-
-class OwRadarR60abd1StateBreathInfo(IntEnum):
+class OwRadarR60abd1StateBreathInfo(OwRadarIntEnum):
     """Enumeration representing breath info from OwRadar."""
 
     UNSET = 0
@@ -266,35 +127,17 @@ class OwRadarR60abd1StateBreathInfo(IntEnum):
     NONE = 4
 
 
-@dataclass
-class OwRadarR60abd1StateBreath:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateBreath(OwRadarModel):
     """Object holding breath state in OwRadar."""
 
     info: OwRadarR60abd1StateBreathInfo = OwRadarR60abd1StateBreathInfo.UNSET
     rate: int = 0
     waves: OwRadarR60abd1StateWaves = field(default_factory=OwRadarR60abd1StateWaves)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateBreath:
-        """
-        Update and Return Breath object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
 
-        Returns:
-        -------
-            An Breath object.
-
-        """
-        self.info = OwRadarR60abd1StateBreathInfo(data.get("info", self.info))
-        self.rate = data.get("rate", self.rate)
-        self.waves = self.waves.update_from_dict(data.get("waves", self.waves.__dict__))
-
-        return self
-
-
-class OwRadarR60abd1StateSleepAway(IntEnum):
+class OwRadarR60abd1StateSleepAway(OwRadarIntEnum):
     """Enumeration representing sleep away from OwRadar."""
 
     OUT = 0
@@ -302,7 +145,7 @@ class OwRadarR60abd1StateSleepAway(IntEnum):
     ACTIVE = 2
 
 
-class OwRadarR60abd1StateSleepStatus(IntEnum):
+class OwRadarR60abd1StateSleepStatus(OwRadarIntEnum):
     """Enumeration representing sleep status from OwRadar."""
 
     DEEP = 0
@@ -311,7 +154,7 @@ class OwRadarR60abd1StateSleepStatus(IntEnum):
     NONE = 3
 
 
-class OwRadarR60abd1StateSleepException(IntEnum):
+class OwRadarR60abd1StateSleepException(OwRadarIntEnum):
     """Enumeration representing sleep exception from OwRadar."""
 
     LESS_4HOUR = 0
@@ -320,7 +163,7 @@ class OwRadarR60abd1StateSleepException(IntEnum):
     NONE = 3
 
 
-class OwRadarR60abd1StateSleepRating(IntEnum):
+class OwRadarR60abd1StateSleepRating(OwRadarIntEnum):
     """Enumeration representing sleep rating from OwRadar."""
 
     NONE = 0
@@ -329,7 +172,7 @@ class OwRadarR60abd1StateSleepRating(IntEnum):
     BAD = 3
 
 
-class OwRadarR60abd1StateSleepStruggle(IntEnum):
+class OwRadarR60abd1StateSleepStruggle(OwRadarIntEnum):
     """Enumeration representing sleep struggle from OwRadar."""
 
     NONE = 0
@@ -337,7 +180,7 @@ class OwRadarR60abd1StateSleepStruggle(IntEnum):
     ABNORMAL = 2
 
 
-class OwRadarR60abd1StateSleepNobody(IntEnum):
+class OwRadarR60abd1StateSleepNobody(OwRadarIntEnum):
     """Enumeration representing sleep nobody from OwRadar."""
 
     NONE = 0
@@ -345,8 +188,9 @@ class OwRadarR60abd1StateSleepNobody(IntEnum):
     ABNORMAL = 2
 
 
-@dataclass
-class OwRadarR60abd1StateSleepOverview:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateSleepOverview(OwRadarModel):
     """
     Object holding sleep overview state in OwRadar.
 
@@ -369,37 +213,10 @@ class OwRadarR60abd1StateSleepOverview:
     seratio: int = 0
     pause: int = 0
 
-    def update_from_dict(
-        self, data: dict[str, Any]
-    ) -> OwRadarR60abd1StateSleepOverview:
-        """
-        Return SleepOverview object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An SleepOverview object.
-
-        """
-        self.presence = OwRadarR60abd1StateBodyPresence(
-            data.get("presence", self.presence)
-        )
-        self.status = OwRadarR60abd1StateSleepStatus(data.get("status", self.status))
-        self.heart = data.get("heart", self.heart)
-        self.breath = data.get("breath", self.breath)
-        self.turn = data.get("turn", self.turn)
-        self.leratio = data.get("leratio", self.leratio)
-        self.seratio = data.get("seratio", self.seratio)
-        self.pause = data.get("pause", self.pause)
-
-        return self
-
-
-@dataclass
-class OwRadarR60abd1StateSleepQuality:
+
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateSleepQuality(OwRadarModel):
     """
     Object holding sleep quality state in OwRadar.
 
@@ -425,36 +242,10 @@ class OwRadarR60abd1StateSleepQuality:
     heart: int = 0
     pause: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateSleepQuality:
-        """
-        Return SleepQuality object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An SleepQuality object.
 
-        """
-        self.score = data.get("score", self.score)
-        self.duration = data.get("duration", self.duration)
-        self.awake = data.get("awake", self.awake)
-        self.light = data.get("light", self.light)
-        self.deep = data.get("deep", self.deep)
-        self.aduration = data.get("aduration", self.aduration)
-        self.away = data.get("away", self.away)
-        self.turn = data.get("turn", self.turn)
-        self.breath = data.get("breath", self.breath)
-        self.heart = data.get("heart", self.heart)
-        self.pause = data.get("pause", self.pause)
-
-        return self
-
-
-@dataclass
-class OwRadarR60abd1StateSleep:
+@compile_model
+@dataclass(slots=True)
+class OwRadarR60abd1StateSleep(OwRadarModel):
     """
     Object holding sleep state in OwRadar.
 
@@ -487,44 +278,9 @@ class OwRadarR60abd1StateSleep:
     struggle: OwRadarR60abd1StateSleepStruggle = OwRadarR60abd1StateSleepStruggle.NONE
     nobody: OwRadarR60abd1StateSleepNobody = OwRadarR60abd1StateSleepNobody.NONE
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1StateSleep:
-        """
-        Update and Return Sleep object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An Sleep object.
-
-        """
-        self.away = OwRadarR60abd1StateSleepAway(data.get("away", self.away))
-        self.status = OwRadarR60abd1StateSleepStatus(data.get("status", self.status))
-        self.awake = data.get("awake", self.awake)
-        self.light = data.get("light", self.light)
-        self.deep = data.get("deep", self.deep)
-        self.score = data.get("score", self.score)
-        self.overview = self.overview.update_from_dict(
-            data.get("overview", self.overview.__dict__)
-        )
-        self.quality = self.quality.update_from_dict(
-            data.get("quality", self.quality.__dict__)
-        )
-        self.exception = OwRadarR60abd1StateSleepException(
-            data.get("exception", self.exception)
-        )
-        self.rating = OwRadarR60abd1StateSleepRating(data.get("rating", self.rating))
-        self.struggle = OwRadarR60abd1StateSleepStruggle(
-            data.get("struggle", self.struggle)
-        )
-        self.nobody = OwRadarR60abd1StateSleepNobody(data.get("nobody", self.nobody))
-
-        return self
-
-
-@dataclass
+
+@compile_model
+@dataclass(slots=True)
 class OwRadarR60abd1State(OwRadarCommonState):
     """
     Object holding State Information from OwRadar.
@@ -544,29 +300,9 @@ class OwRadarR60abd1State(OwRadarCommonState):
     breath: OwRadarR60abd1StateBreath = field(default_factory=OwRadarR60abd1StateBreath)
     sleep: OwRadarR60abd1StateSleep = field(default_factory=OwRadarR60abd1StateSleep)
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1State:
-        """
-        Update Return State object form OwRadar API response.
-
-        Args:
-        ----
-            data: The response from the OwRadar API.
-
-        Returns:
-        -------
-            An State object.
 
-        """
-        super().update_from_dict(data)
-        self.body.update_from_dict(data.get("body", self.body.__dict__))
-        self.breath.update_from_dict(data.get("breath", self.breath.__dict__))
-        self.heart.update_from_dict(data.get("heart", self.heart.__dict__))
-        self.sleep.update_from_dict(data.get("sleep", self.sleep.__dict__))
-
-        return self
-
-
-@dataclass
+@compile_model
+@dataclass(slots=True)
 class OwRadarR60abd1Setting(OwRadarCommonSetting):
     """
     Object holding R60ABD1 Setting information from OwRadar.
@@ -591,34 +327,9 @@ class OwRadarR60abd1Setting(OwRadarCommonSetting):
     struggle: OwRadarCommonSettingSwitch = OwRadarCommonSettingSwitch.OFF
     stop_duration: int = 0
 
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Setting:
-        """
-        Update and Return Device information object from OwRadar API response.
-
-        Args:
-        ----
-            data: The data from the OwRadar device API.
-
-        Returns:
-        -------
-            A Device information object.
-
-        """
-        super().update_from_dict(data)
-        self.body = data.get("body", self.body)
-        self.heart = data.get("heart", self.heart)
-        self.breath = data.get("breath", self.breath)
-        self.sleep = data.get("sleep", self.sleep)
-        self.mode = data.get("mode", self.mode)
-        self.nobody = data.get("nobody", self.nobody)
-        self.nobody_duration = data.get("nobody_duration", self.nobody_duration)
-        self.struggle = data.get("struggle", self.struggle)
-        self.stop_duration = data.get("stop_duration", self.stop_duration)
 
-        return self
-
-
-@dataclass
+@compile_model
+@dataclass(slots=True)
 class OwRadarR60abd1Device(OwRadarCommonDevice):
     """
     Object holding Device Information from OwRadar.
@@ -638,21 +349,3 @@ class OwRadarR60abd1Device(OwRadarCommonDevice):
     stats: OwRadarR60abd1Stats = field(default_factory=OwRadarR60abd1Stats)
     snap: OwRadarR60abd1Snap = field(default_factory=OwRadarR60abd1Snap)
     event: OwRadarR60abd1Event = field(default_factory=OwRadarR60abd1Event)
-
-    def update_from_dict(self, data: dict[str, Any]) -> OwRadarR60abd1Device:
-        """
-        Update and Return Device object from OwRadar API response.
-
-        Args:
-        ----
-            data: Update the device object with the data received from a
-                OwRadar device API.
-
-        Returns:
-        -------
-            The updated Device object.
-
-        """
-        super().update_from_dict(data)
-        self.setting.update_from_dict(data.get("setting", self.setting.__dict__))
-        return self
@@ -0,0 +1,93 @@
+"""
+Round-trip time estimation for OwRadar devices.
+
+`OwRadarRttEstimator` keeps a smoothed round-trip time and its variance
+from the requests answered by a device, as TCP does (RFC 6298), and
+derives the timeouts of the client from them: a device answering in
+50 ms times out after a couple of seconds instead of the configured
+worst case. Timed out requests give no sample (Karn's algorithm), they
+double the timeout until the device answers again.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Smoothing gains of RFC 6298
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+# Floor of the variance term, the granularity of the event loop clock
+_GRANULARITY = 0.01
+# Doublings of the timeout after consecutive timeouts
+_BACKOFF_MAX = 6
+
+# Bounds of the WebSocket heartbeat, in seconds
+HEARTBEAT_MIN = 2.0
+HEARTBEAT_MAX = 30.0
+
+
+@dataclass
+class OwRadarRttEstimator:
+    """Smoothed round-trip time of a device, and the timeouts derived from it."""
+
+    # Lowest timeout, however fast the device answers; a busy device, e.g.
+    # writing its flash or reconnecting to WiFi, answers late now and then
+    minimum: float = 2.0
+    srtt: float | None = None
+    rttvar: float = 0.0
+    samples: int = 0
+    timeouts: int = 0
+    _backoff: int = 0
+
+    @property
+    def rto(self) -> float | None:
+        """Return the retransmission timeout, None before the first sample."""
+        if self.srtt is None:
+            return None
+        rto = max(self.minimum, self.srtt + max(_GRANULARITY, 4 * self.rttvar))
+        return rto * 2**self._backoff
+
+    @property
+    def heartbeat(self) -> float:
+        """
+        Return the WebSocket heartbeat interval.
+
+        aiohttp closes a socket whose pong is not back within half the
+        interval, so a dead connection is noticed within 1.5 of it.
+        """
+        if (rto := self.rto) is None:
+            return HEARTBEAT_MAX
+        return min(HEARTBEAT_MAX, max(HEARTBEAT_MIN, 4 * rto))
+
+    def timeout(self, limit: float) -> float:
+        """
+        Return the timeout of a request.
+
+        Args:
+        ----
+            limit: The longest timeout, used until the first sample.
+
+        Returns:
+        -------
+            The timeout, in seconds.
+
+        """
+        if (rto := self.rto) is None:
+            return limit
+        return min(limit, rto)
+
+    def sample(self, rtt: float) -> None:
+        """Record the round-trip time of an answered request."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += _BETA * (abs(self.srtt - rtt) - self.rttvar)
+            self.srtt += _ALPHA * (rtt - self.srtt)
+        self.samples += 1
+        self._backoff = 0
+
+    def backoff(self) -> None:
+        """Record a timed out request, doubling the timeout."""
+        self.timeouts += 1
+        self._backoff = min(self._backoff + 1, _BACKOFF_MAX)
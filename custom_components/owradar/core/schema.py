@@ -0,0 +1,252 @@
+"""
+Schema driven updaters for the OwRadar models.
+
+`compile_model` reads the fields of a model dataclass once, at import
+time, and generates its `update_from_dict` and change tracking updater as
+straight-line code: one dictionary lookup per field, IntEnum fields
+coerced through precomputed tables (see `enum_table`), nested models
+updated in place. Fields missing from the data keep their value, without
+building default dictionaries, as do IntEnum fields sent a value that is
+not an integer, e.g. null.
+
+A field is read from the key of its name, unless its metadata names
+another one, e.g. `field(default="", metadata={"key": "mac"})`.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import fields
+from enum import IntEnum
+from functools import cache
+from typing import Any, TypeVar, get_type_hints
+
+_ModelT = TypeVar("_ModelT", bound=type["OwRadarModel"])
+_EnumT = TypeVar("_EnumT", bound=IntEnum)
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class OwRadarIntEnum(IntEnum):
+    """
+    Base class of the OwRadar enumerations.
+
+    Values unknown to this version, e.g. sent by a newer firmware, do not
+    raise but give an `UNKNOWN_<value>` pseudo-member, which compares
+    equal to its value and is not part of the enumeration. Any other value
+    still raises `ValueError`, the model updaters keep the previous member.
+    """
+
+    @classmethod
+    def _missing_(cls, value: object) -> OwRadarIntEnum | None:
+        """Return a pseudo-member for an unknown integer value."""
+        if not isinstance(value, int) or isinstance(value, bool):
+            return None
+        member = int.__new__(cls, value)
+        member._name_ = f"UNKNOWN_{value}"
+        member._value_ = value
+        return member
+
+
+class OwRadarEnumTable(dict[Any, _EnumT]):
+    """
+    Lookup table from raw values to the members of an enumeration.
+
+    Known values are plain dictionary hits; any other value goes once
+    through the enumeration, which may raise `ValueError`, and is cached.
+    """
+
+    def __init__(self, kind: type[_EnumT]) -> None:
+        """Initialize with the members of the enumeration."""
+        super().__init__((member.value, member) for member in kind)
+        self.kind = kind
+
+    def __missing__(self, value: Any) -> _EnumT:
+        """Convert and cache a value that is not a known member value."""
+        member = self[value] = self.kind(value)
+        return member
+
+
+@cache
+def enum_table(kind: type[_EnumT]) -> OwRadarEnumTable[_EnumT]:
+    """Return the shared lookup table of an enumeration."""
+    return OwRadarEnumTable(kind)
+
+
+class OwRadarModel:
+    """
+    Base class of the OwRadar models.
+
+    Subclasses are slotted dataclasses decorated with `compile_model`,
+    which generates their updaters. The base has no instance dictionary
+    either, so a device tree only stores its field values.
+    """
+
+    __slots__ = ()
+
+    def update_from_dict(self, data: dict[str, Any]) -> Any:
+        """
+        Update the object from an OwRadar API response.
+
+        Args:
+        ----
+            data: The response from the OwRadar API.
+
+        Returns:
+        -------
+            The updated object.
+
+        """
+        compile_model(type(self))
+        return self.update_from_dict(data)
+
+    def update_changes(self, data: dict[str, Any], prefix: str = "") -> set[str]:
+        """
+        Update the object from an OwRadar API response, tracking changes.
+
+        Values are compared as they are assigned, nothing is copied or
+        snapshotted.
+
+        Args:
+        ----
+            data: The response from the OwRadar API.
+            prefix: Prefix of the returned field paths, e.g. `state.`.
+
+        Returns:
+        -------
+            The dotted paths of the fields that changed.
+
+        """
+        changes: set[str] = set()
+        self._collect_changes(data, prefix, changes)
+        return changes
+
+    def _collect_changes(
+        self, data: dict[str, Any], prefix: str, changes: set[str]
+    ) -> None:
+        """Update the fields present in data, recording the changed ones."""
+        compile_model(type(self))
+        self._collect_changes(data, prefix, changes)
+
+
+@cache
+def field_paths(cls: type[OwRadarModel]) -> frozenset[str]:
+    """
+    Return the dotted paths of every field of a model, nested ones included.
+
+    Args:
+    ----
+        cls: The model dataclass.
+
+    Returns:
+    -------
+        The paths, e.g. `state.body` and `state.body.presence`.
+
+    """
+    paths = set()
+    for name, kind in get_type_hints(cls).items():
+        if name not in cls.__dataclass_fields__:
+            continue
+        paths.add(name)
+        if _is_subclass(kind, OwRadarModel):
+            paths.update(f"{name}.{path}" for path in field_paths(kind))
+    return frozenset(paths)
+
+
+def _is_subclass(kind: Any, base: type) -> bool:
+    """Return if a resolved type hint is a subclass of base."""
+    return isinstance(kind, type) and issubclass(kind, base)
+
+
+def _invalid(model: OwRadarModel, name: str, value: Any) -> None:
+    """Log a value that could not be converted, the field keeps its value."""
+    _LOGGER.debug(
+        "Ignoring invalid value %r of %s.%s", value, type(model).__name__, name
+    )
+
+
+def compile_model(cls: _ModelT) -> _ModelT:
+    """
+    Generate the updaters of a model dataclass.
+
+    Args:
+    ----
+        cls: The model dataclass, whose nested model types must be defined.
+
+    Returns:
+    -------
+        The same class, with `update_from_dict` and `_collect_changes`.
+
+    """
+    hints = get_type_hints(cls)
+    namespace: dict[str, Any] = {"_MISSING": _MISSING, "_invalid": _invalid}
+    update = ["def update_from_dict(self, data):", "    get = data.get"]
+    collect = [
+        "def _collect_changes(self, data, prefix, changes):",
+        "    get = data.get",
+    ]
+    for item in fields(cls):  # type: ignore[arg-type]
+        name = item.name
+        key = item.metadata.get("key", name)
+        kind = hints[name]
+        lookup = f"    value = get({key!r}, _MISSING)"
+        if _is_subclass(kind, OwRadarModel):
+            # A nested model sent as null, or any other non-object, is
+            # skipped and keeps its values.
+            update += [
+                lookup,
+                "    if value.__class__ is dict:",
+                f"        self.{name}.update_from_dict(value)",
+            ]
+            collect += [
+                lookup,
+                "    if value.__class__ is dict:",
+                f"        self.{name}._collect_changes("
+                f"value, prefix + {name + '.'!r}, changes)",
+            ]
+            continue
+        if not _is_subclass(kind, IntEnum):
+            update += [
+                lookup,
+                "    if value is not _MISSING:",
+                f"        self.{name} = value",
+            ]
+            collect += [
+                lookup,
+                f"    if value is not _MISSING and value != self.{name}:",
+                f"        self.{name} = value",
+                f"        changes.add(prefix + {name!r})",
+            ]
+            continue
+        # A value no member can be made of keeps the previous one, instead
+        # of failing the whole frame.
+        namespace[f"_{name}_table"] = enum_table(kind)
+        coerce = [
+            "        try:",
+            f"            self.{name} = _{name}_table[value]",
+            "        except (TypeError, ValueError):",
+            f"            _invalid(self, {name!r}, value)",
+        ]
+        update += [lookup, "    if value is not _MISSING:", *coerce]
+        # IntEnum members compare equal to their raw values, so only
+        # changed values pay for the conversion.
+        collect += [
+            lookup,
+            f"    if value is not _MISSING and value != self.{name}:",
+            *coerce,
+            "        else:",
+            f"            changes.add(prefix + {name!r})",
+        ]
+    update.append("    return self")
+
+    source = "\n".join(update + collect)
+    exec(compile(source, f"<owradar-schema {cls.__qualname__}>", "exec"), namespace)  # noqa: S102
+    for method in ("update_from_dict", "_collect_changes"):
+        function = namespace[method]
+        function.__qualname__ = f"{cls.__qualname__}.{method}"
+        function.__module__ = cls.__module__
+        function.__doc__ = getattr(OwRadarModel, method).__doc__
+        setattr(cls, method, function)
+    return cls
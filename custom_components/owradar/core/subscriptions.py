@@ -0,0 +1,202 @@
+"""Field subscriptions for OwRadar."""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import OwRadarError
+from .schema import OwRadarModel, field_paths
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    FieldCallback = Callable[[Any, frozenset[str]], None]
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class OwRadarSubscriptions:
+    """
+    Registry of callbacks interested in specific device fields.
+
+    Fields are addressed by dotted paths from the device, for example
+    `state.body.presence`; the first segment names the channel the field
+    is updated by. A callback only runs when one of its fields changed,
+    with the device and the set of its fields that changed.
+
+    Changes are collected as frames are applied, see `collect()`, and the
+    callbacks run later by `dispatch()`, so the WebSocket reader does not
+    wait for them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._subscribers: dict[int, tuple[frozenset[str], FieldCallback]] = {}
+        self._getters: dict[str, Callable[[Any], Any]] = {}
+        self._values: dict[str, Any] = {}
+        self._refs: dict[str, int] = defaultdict(int)
+        self._channels: dict[str, set[str]] = defaultdict(set)
+        self._next_id = 0
+
+    def __bool__(self) -> bool:
+        """Return if there is any subscriber."""
+        return bool(self._subscribers)
+
+    def subscribe(
+        self,
+        callback: FieldCallback,
+        paths: tuple[str, ...],
+        device: Any = None,
+        model: type[OwRadarModel] | None = None,
+    ) -> Callable[[], None]:
+        """
+        Subscribe a callback to changes of the given fields.
+
+        Args:
+        ----
+            callback: Method to call with the device and the changed fields.
+            paths: Dotted field paths, for example `state.body.presence`.
+                With a model, a nested model such as `state.body` stands
+                for each of its fields, which are then reported as changed.
+            device: The current device, used as baseline for the fields.
+            model: The device model the paths are checked against, the
+                type of `device` by default.
+
+        Returns:
+        -------
+            A function removing the subscription.
+
+        Raises:
+        ------
+            OwRadarError: No field, or a field that does not exist, was given.
+
+        """
+        if not paths:
+            msg = "A subscription needs at least one field"
+            raise OwRadarError(msg)
+        if model is None and isinstance(device, OwRadarModel):
+            model = type(device)
+        if model is not None:
+            known = field_paths(model)
+            if unknown := set(paths) - known:
+                msg = f"Unknown fields {sorted(unknown)}"
+                raise OwRadarError(msg)
+            paths = _leaf_paths(paths, known)
+        getters = {path: self._getters.get(path) or attrgetter(path) for path in paths}
+        values = {}
+        if device is not None:
+            for path, getter in getters.items():
+                try:
+                    values[path] = getter(device)
+                except AttributeError as exception:
+                    msg = f"Unknown field `{path}`"
+                    raise OwRadarError(msg) from exception
+        for path, getter in getters.items():
+            if path in values:
+                self._values.setdefault(path, values[path])
+            self._getters[path] = getter
+            self._refs[path] += 1
+            self._channels[path.partition(".")[0]].add(path)
+
+        subscription_id = self._next_id
+        self._next_id += 1
+        self._subscribers[subscription_id] = (frozenset(getters), callback)
+
+        def unsubscribe() -> None:
+            if self._subscribers.pop(subscription_id, None) is None:
+                return
+            for path in getters:
+                self._refs[path] -= 1
+                if self._refs[path]:
+                    continue
+                del self._refs[path]
+                del self._getters[path]
+                self._values.pop(path, None)
+                self._channels[path.partition(".")[0]].discard(path)
+
+        return unsubscribe
+
+    def notify(
+        self, device: Any, channel: str, changes: set[str] | None = None
+    ) -> None:
+        """
+        Run the callbacks whose fields changed after an update, right away.
+
+        See `collect()` for the arguments.
+        """
+        self.dispatch(device, self.collect(device, channel, changes))
+
+    def collect(
+        self, device: Any, channel: str, changes: set[str] | None = None
+    ) -> set[str]:
+        """
+        Return the subscribed fields that changed after an update.
+
+        Args:
+        ----
+            device: The updated device.
+            channel: The channel that has been updated.
+            changes: The paths of the fields that changed, when known. When
+                not, the subscribed fields of the channel are compared with
+                their last seen values.
+
+        Returns:
+        -------
+            The paths of the subscribed fields that changed.
+
+        """
+        if changes is None:
+            return self._compare(device, channel)
+        subscribed = self._getters.keys() & changes
+        for path in subscribed:
+            self._values[path] = self._getters[path](device)
+        return subscribed
+
+    def dispatch(self, device: Any, changes: set[str]) -> None:
+        """
+        Run the callbacks of the fields that changed.
+
+        A failing callback is logged, and does not keep the others from
+        running.
+        """
+        if not changes:
+            return
+        for fields, callback in list(self._subscribers.values()):
+            if hits := fields.intersection(changes):
+                try:
+                    callback(device, hits)
+                except Exception:
+                    _LOGGER.exception("Error in subscriber of %s", sorted(hits))
+
+    def _compare(self, device: Any, channel: str) -> set[str]:
+        """Return the subscribed fields of a channel that changed."""
+        changed = set()
+        values = self._values
+        for path in self._channels.get(channel, ()):
+            value = self._getters[path](device)
+            if values.get(path, _MISSING) != value:
+                values[path] = value
+                changed.add(path)
+        return changed
+
+
+def _leaf_paths(paths: tuple[str, ...], known: frozenset[str]) -> tuple[str, ...]:
+    """Return the paths, with nested models replaced by the paths of their fields."""
+    parents = {path.rpartition(".")[0] for path in known}
+    leaves: dict[str, None] = {}
+    for path in paths:
+        if path not in parents:
+            leaves[path] = None
+            continue
+        prefix = f"{path}."
+        leaves.update(
+            dict.fromkeys(
+                sorted(leaf for leaf in known - parents if leaf.startswith(prefix))
+            )
+        )
+    return tuple(leaves)
@@ -0,0 +1,141 @@
+"""
+Waveform ring buffers for OwRadar.
+
+Every R60ABD1 state frame carries the latest five heart and breath wave
+samples, `w0` to `w4`. The buffers keep a fixed history of them in a
+preallocated NumPy array, written twice, at `i` and `i + capacity`, so
+that the latest samples are always a contiguous slice: windows are views,
+appending does not allocate.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .r60abd1_models import OwRadarR60abd1StateWaves
+
+WAVE_CAPACITY = 1024
+
+
+class OwRadarWaveAggregate(NamedTuple):
+    """Summary of the samples of a wave over a window."""
+
+    minimum: int
+    maximum: int
+    mean: float
+    rms: float
+    samples: int
+
+
+def aggregate(samples: np.ndarray) -> OwRadarWaveAggregate | None:
+    """
+    Summarize wave samples.
+
+    Args:
+    ----
+        samples: The samples of the window.
+
+    Returns:
+    -------
+        Their minimum, maximum, mean and root mean square, None when there
+        is no sample.
+
+    """
+    if not len(samples):
+        return None
+    values = samples.astype(np.float64)
+    return OwRadarWaveAggregate(
+        int(samples.min()),
+        int(samples.max()),
+        float(values.mean()),
+        float(np.sqrt(np.dot(values, values) / len(values))),
+        len(samples),
+    )
+
+
+class OwRadarWaveBuffer:
+    """Fixed-size ring buffer of waveform samples."""
+
+    __slots__ = ("_data", "_head", "capacity", "total")
+
+    def __init__(self, capacity: int = WAVE_CAPACITY) -> None:
+        """
+        Initialize.
+
+        Args:
+        ----
+            capacity: The number of samples kept.
+
+        """
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=np.int16)
+        self._head = 0
+        # Samples appended since the buffer was created
+        self.total = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self.total, self.capacity)
+
+    def append(self, sample: int) -> None:
+        """Append one sample, overwriting the oldest once full."""
+        data = self._data
+        head = self._head
+        data[head] = data[head + self.capacity] = sample
+        self._head = (head + 1) % self.capacity
+        self.total += 1
+
+    def extend_waves(self, waves: OwRadarR60abd1StateWaves) -> None:
+        """Append the five samples of a wave frame, `w0` first."""
+        append = self.append
+        append(waves.w0)
+        append(waves.w1)
+        append(waves.w2)
+        append(waves.w3)
+        append(waves.w4)
+
+    def window(self, size: int | None = None) -> np.ndarray:
+        """
+        Return the latest samples, oldest first.
+
+        Args:
+        ----
+            size: The number of samples, all those held by default.
+
+        Returns:
+        -------
+            A read-only view on the buffer, only valid until the next
+            append; copy it to keep it.
+
+        """
+        held = len(self)
+        size = held if size is None else min(size, held)
+        end = self._head + self.capacity
+        view = self._data[end - size : end]
+        view.flags.writeable = False
+        return view
+
+    def since(self, total: int) -> np.ndarray:
+        """
+        Return the samples appended since a previous `total`, oldest first.
+
+        Only the samples still held are returned.
+
+        Args:
+        ----
+            total: A previous value of `total`.
+
+        Returns:
+        -------
+            A read-only view, see `window()`.
+
+        """
+        return self.window(max(self.total - total, 0))
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._head = 0
+        self.total = 0
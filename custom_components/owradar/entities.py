@@ -1,9 +1,42 @@
 """Models for OwRadar."""
+from __future__ import annotations
+
+from typing import Any
+
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import OwRadarDataUpdateCoordinator
+from .core.schema import OwRadarModel
+
+
+def resolve_field_path(key: str, device: Any) -> str | None:
+    """
+    Resolve an entity key to the device field it names.
+
+    Keys join the attribute names of the path with underscores, which also
+    appear inside attribute names, e.g. `snap_body_location_x` is
+    `snap.body_location_x` while `state_body_location_x` is
+    `state.body.location.x`. Returns None when no field matches.
+    """
+    parts = key.split("_")
+
+    def resolve(obj: Any, start: int) -> list[str] | None:
+        for end in range(start + 1, len(parts) + 1):
+            name = "_".join(parts[start:end])
+            if (value := getattr(obj, name, None)) is None:
+                continue
+            nested = isinstance(value, OwRadarModel)
+            if end == len(parts):
+                if not nested:
+                    return [name]
+            elif nested and (rest := resolve(value, end)) is not None:
+                return [name, *rest]
+        return None
+
+    path = resolve(device, 0)
+    return ".".join(path) if path else None
 
 
 class OwRadarEntity(CoordinatorEntity[OwRadarDataUpdateCoordinator]):
@@ -11,6 +44,23 @@ class OwRadarEntity(CoordinatorEntity[OwRadarDataUpdateCoordinator]):
 
     _attr_has_entity_name = True
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to pushed changes of the fields the entity reads."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_field_listener(
+                self._handle_coordinator_update, self._fields()
+            )
+        )
+
+    def _fields(self) -> tuple[str, ...] | None:
+        """Return the device fields the entity reads, None if unknown."""
+        description = self.entity_description
+        if (fields := getattr(description, "fields", None)) is not None:
+            return fields
+        path = resolve_field_path(description.key, self.coordinator.data)
+        return (path,) if path else None
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this OwRadar device."""
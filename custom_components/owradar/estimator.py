@@ -0,0 +1,171 @@
+"""Batched heart and breath rate estimation for owradar."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import numpy as np
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, LOGGER, RATE_INTERVAL, SIGNAL_RATES
+from .core.dsp import (
+    BREATH_BAND,
+    HEART_BAND,
+    RATE_WINDOW,
+    OwRadarRate,
+)
+from .core.pool import OwRadarDspPool
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .coordinator import OwRadarDataUpdateCoordinator
+
+DATA_ESTIMATOR = f"{DOMAIN}_estimator"
+
+BANDS = {"heart": HEART_BAND, "breath": BREATH_BAND}
+
+
+@callback
+def async_get_estimator(hass: HomeAssistant) -> OwRadarRateEstimator:
+    """Return the rate estimator shared by every OwRadar device."""
+    if (estimator := hass.data.get(DATA_ESTIMATOR)) is None:
+        estimator = hass.data[DATA_ESTIMATOR] = OwRadarRateEstimator(hass)
+    return estimator
+
+
+class OwRadarRateEstimator:
+    """Estimate the rates of every OwRadar device in one batch per tick."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._coordinators: list[OwRadarDataUpdateCoordinator] = []
+        # Samples seen at the last estimation, per coordinator and wave
+        self._seen: dict[tuple[int, str], int] = {}
+        self._unsub_tick: CALLBACK_TYPE | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+        # Latest start or shutdown of the pool, run one after the other
+        self._pool_job: asyncio.Task | None = None
+        self.pool = OwRadarDspPool()
+
+    @callback
+    def async_register(
+        self, coordinator: OwRadarDataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Estimate the rates of a device until the returned callback is called."""
+        self._coordinators.append(coordinator)
+        if self._unsub_tick is None:
+            self._async_pool_job(self.pool.start)
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, RATE_INTERVAL
+            )
+            self._unsub_stop = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop
+            )
+
+        @callback
+        def unregister() -> None:
+            self._coordinators.remove(coordinator)
+            for wave in BANDS:
+                self._seen.pop((id(coordinator), wave), None)
+            if not self._coordinators:
+                self._async_shutdown()
+
+        return unregister
+
+    @callback
+    def _async_shutdown(self) -> None:
+        """Stop estimating, then the pool and its shared memory."""
+        if self._unsub_tick is None:
+            return
+        self._unsub_tick()
+        self._unsub_tick = None
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        self._async_pool_job(self.pool.shutdown)
+
+    async def _async_stop(self, _event: Event) -> None:
+        """Stop the pool when Home Assistant stops, waiting for the workers."""
+        self._unsub_stop = None
+        self._async_shutdown()
+        if self._pool_job is not None:
+            await self._pool_job
+
+    @callback
+    def _async_pool_job(self, target: Callable[[], None]) -> None:
+        """Run a blocking start or shutdown of the pool in the executor."""
+        previous = self._pool_job
+
+        async def run() -> None:
+            if previous is not None:
+                await asyncio.wait([previous])
+            await self.hass.async_add_executor_job(target)
+
+        self._pool_job = self.hass.async_create_background_task(
+            run(), "owradar-dsp-pool"
+        )
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Batch the windows of the devices that received new samples."""
+        for wave in BANDS:
+            ready = []
+            for coordinator in self._coordinators:
+                buffer = coordinator.client.waves[wave]
+                key = (id(coordinator), wave)
+                if len(buffer) >= RATE_WINDOW and self._seen.get(key) != buffer.total:
+                    self._seen[key] = buffer.total
+                    ready.append(coordinator)
+            if not ready:
+                continue
+
+            batch = np.empty((len(ready), RATE_WINDOW))
+            for row, coordinator in enumerate(ready):
+                batch[row] = coordinator.client.waves[wave].window(RATE_WINDOW)
+            self.hass.async_create_background_task(
+                self._async_estimate(wave, ready, batch), f"owradar-estimate-{wave}"
+            )
+
+    async def _async_estimate(
+        self,
+        wave: str,
+        coordinators: list[OwRadarDataUpdateCoordinator],
+        batch: np.ndarray,
+    ) -> None:
+        """Estimate a batch in the pool and hand the rates to the devices."""
+        estimates = await self.pool.estimate(batch, BANDS[wave])
+        stats = self.pool.stats
+        if estimates is None:
+            LOGGER.debug("Rate estimation busy, %s batches dropped", stats.dropped)
+            # Estimate these devices again on the next tick
+            for coordinator in coordinators:
+                self._seen.pop((id(coordinator), wave), None)
+            return
+        LOGGER.debug(
+            "Estimated %s %s rates in %.1f ms (mean %.1f ms, max %.1f ms)",
+            len(coordinators),
+            wave,
+            stats.last_latency * 1e3,
+            stats.mean_latency * 1e3,
+            stats.max_latency * 1e3,
+        )
+
+        for row, coordinator in enumerate(coordinators):
+            if coordinator not in self._coordinators:
+                continue
+            rate = estimates.rate[row]
+            coordinator.rates[wave] = OwRadarRate(
+                None if np.isnan(rate) else float(rate),
+                float(estimates.confidence[row]),
+                float(estimates.quality[row]),
+            )
+            async_dispatcher_send(
+                self.hass, SIGNAL_RATES.format(coordinator.config_entry.entry_id)
+            )
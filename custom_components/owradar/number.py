@@ -34,6 +34,8 @@ class OwRadarNumberEntityDescription(
     """Describes OwRadar number entity."""
 
     exists_fn: Callable[[Any], bool] = lambda _: True
+    # Device fields read by value_fn, resolved from the key when not given
+    fields: tuple[str, ...] | None = None
 
 
 COMMON_SETTING_NUMBERS: tuple[OwRadarNumberEntityDescription, ...] = (
@@ -46,7 +48,7 @@ COMMON_SETTING_NUMBERS: tuple[OwRadarNumberEntityDescription, ...] = (
         native_min_value=3,
         native_max_value=60,
         native_unit_of_measurement="MIN",
-        value_fn=lambda device: device.setting.nobody_duration,
+        value_fn=lambda device: device.setting.interval,
         update_fn=lambda coordinator, value: coordinator.client.setting(data={"interval": value}),
     ),
 )
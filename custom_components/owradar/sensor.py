@@ -1,10 +1,10 @@
 """Sensor platform for owradar."""
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,15 +14,33 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    SENSOR_MIN_INTERVAL,
+    SIGNAL_AGGREGATES,
+    SIGNAL_RATES,
+    WAVEFORM_SAMPLES,
+)
 from .coordinator import OwRadarDataUpdateCoordinator
 from .core.common_models import OwRadarCommonSettingSwitch
 from .entities import OwRadarEntity
 
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
+    from .core.dsp import OwRadarRate
+
+
+def _websocket_enabled(device: Any) -> bool:
+    """Return if the device pushes its state, and waves, over WebSocket."""
+    return device.setting.websocket_state == OwRadarCommonSettingSwitch.ON
+
 
 @dataclass
 class OwRadarSensorEntityDescriptionMixin:
@@ -38,6 +56,21 @@ class OwRadarSensorEntityDescription(
     """Describes OwRadar sensor entity."""
 
     exists_fn: Callable[[Any], bool] = lambda _: True
+    # Device fields read by value_fn, resolved from the key when not given
+    fields: tuple[str, ...] | None = None
+    attributes_fn: (
+        Callable[[OwRadarDataUpdateCoordinator], dict[str, Any]] | None
+    ) = None
+    # Write filters of numeric values, see OwSensorEntity: changes up to
+    # deadband from the last written value are dropped, reversals of the
+    # last written change must also exceed hysteresis, and writes are at
+    # most one per min_interval.
+    deadband: float = 0
+    hysteresis: float = 0
+    min_interval: timedelta | None = None
+    # Write only once this many new wave samples are buffered, so a sensor
+    # showing the waves is recorded once per window rather than per frame
+    wave_window: int | None = None
 
 
 R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
@@ -46,14 +79,14 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         translation_key="state_body_range",
         device_class=SensorDeviceClass.ENUM,
         value_fn=lambda device: device.state.body.range,
-        exists_fn=lambda device: device.setting.websocket_state == OwRadarCommonSettingSwitch.ON,
+        exists_fn=_websocket_enabled,
     ),
     OwRadarSensorEntityDescription(
         key="state_body_presence",
         translation_key="state_body_presence",
         device_class=SensorDeviceClass.ENUM,
         value_fn=lambda device: device.state.body.presence,
-        exists_fn=lambda device: device.setting.websocket_state == OwRadarCommonSettingSwitch.ON,
+        exists_fn=_websocket_enabled,
         icon="mdi:location-enter",
     ),
     OwRadarSensorEntityDescription(
@@ -61,7 +94,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         translation_key="state_body_movement",
         device_class=SensorDeviceClass.ENUM,
         value_fn=lambda device: device.state.body.movement,
-        exists_fn=lambda device: device.setting.websocket_state == OwRadarCommonSettingSwitch.ON,
+        exists_fn=_websocket_enabled,
     ),
     OwRadarSensorEntityDescription(
         key="state_body_energy",
@@ -69,7 +102,10 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.body.energy,
-        exists_fn=lambda device: device.setting.websocket_state == OwRadarCommonSettingSwitch.ON,
+        exists_fn=_websocket_enabled,
+        deadband=2,
+        hysteresis=2,
+        min_interval=SENSOR_MIN_INTERVAL,
     ),
     OwRadarSensorEntityDescription(
         key="state_body_distance",
@@ -78,7 +114,10 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DISTANCE,
         value_fn=lambda device: device.state.body.distance,
-        exists_fn=lambda device: device.setting.websocket_state == OwRadarCommonSettingSwitch.ON,
+        exists_fn=_websocket_enabled,
+        deadband=5,
+        hysteresis=5,
+        min_interval=SENSOR_MIN_INTERVAL,
     ),
     OwRadarSensorEntityDescription(
         key="state_body_location_x",
@@ -87,7 +126,10 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DISTANCE,
         value_fn=lambda device: device.state.body.location.x,
-        exists_fn=lambda device: device.setting.websocket_state == OwRadarCommonSettingSwitch.ON,
+        exists_fn=_websocket_enabled,
+        deadband=5,
+        hysteresis=5,
+        min_interval=SENSOR_MIN_INTERVAL,
     ),
     OwRadarSensorEntityDescription(
         key="state_body_location_y",
@@ -96,6 +138,9 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DISTANCE,
         value_fn=lambda device: device.state.body.location.y,
+        deadband=5,
+        hysteresis=5,
+        min_interval=SENSOR_MIN_INTERVAL,
     ),
     OwRadarSensorEntityDescription(
         key="state_body_location_z",
@@ -104,6 +149,9 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DISTANCE,
         value_fn=lambda device: device.state.body.location.z,
+        deadband=5,
+        hysteresis=5,
+        min_interval=SENSOR_MIN_INTERVAL,
     ),
     OwRadarSensorEntityDescription(
         key="state_heart_rate",
@@ -119,6 +167,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.heart.waves.w0,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_heart_waves_w1",
@@ -126,6 +175,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.heart.waves.w1,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_heart_waves_w2",
@@ -133,6 +183,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.heart.waves.w2,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_heart_waves_w3",
@@ -140,6 +191,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.heart.waves.w3,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_heart_waves_w4",
@@ -147,6 +199,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.heart.waves.w4,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_breath_info",
@@ -168,6 +221,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.breath.waves.w0,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_breath_waves_w1",
@@ -175,6 +229,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.breath.waves.w1,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_breath_waves_w2",
@@ -182,6 +237,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.breath.waves.w2,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_breath_waves_w3",
@@ -189,6 +245,7 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.breath.waves.w3,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
     ),
     OwRadarSensorEntityDescription(
         key="state_breath_waves_w4",
@@ -196,6 +253,23 @@ R60ABD1_STATE_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.state.breath.waves.w4,
         icon="mdi:sine-wave",
+        entity_registry_enabled_default=False,
+    ),
+    OwRadarSensorEntityDescription(
+        key="state_waves",
+        translation_key="state_waves",
+        value_fn=lambda device: device.state.timestamp,
+        attributes_fn=lambda coordinator: {
+            f"{name}_waves": buffer.window(WAVEFORM_SAMPLES).tolist()
+            for name, buffer in coordinator.client.waves.items()
+        },
+        wave_window=WAVEFORM_SAMPLES,
+        fields=tuple(
+            f"state.{name}.waves.w{index}"
+            for name in ("heart", "breath")
+            for index in range(5)
+        ),
+        icon="mdi:sine-wave",
     ),
     OwRadarSensorEntityDescription(
         key="state_sleep_away",
@@ -524,6 +598,99 @@ R60ABD1_EVENT_SENSORS: tuple[OwRadarSensorEntityDescription, ...] = (
     ),
 )
 
+@dataclass
+class OwRadarDerivedSensorEntityDescriptionMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[OwRadarDataUpdateCoordinator], StateType]
+    # Dispatcher signal, formatted with the entry id, of new values
+    signal: str
+
+
+@dataclass
+class OwRadarDerivedSensorEntityDescription(
+    SensorEntityDescription, OwRadarDerivedSensorEntityDescriptionMixin
+):
+    """Describes OwRadar sensor entity computed from buffered waves."""
+
+    exists_fn: Callable[[Any], bool] = lambda _: True
+    attributes_fn: (
+        Callable[[OwRadarDataUpdateCoordinator], dict[str, Any] | None] | None
+    ) = None
+    # Updated through the signal, not by device fields
+    fields: tuple[str, ...] | None = ()
+
+
+def _rate_attributes(estimate: OwRadarRate | None) -> dict[str, Any] | None:
+    """Return the confidence and signal quality of a rate estimate."""
+    if estimate is None:
+        return None
+    return {
+        "confidence": round(estimate.confidence, 3),
+        "quality": round(estimate.quality, 3),
+    }
+
+
+R60ABD1_RATE_SENSORS: tuple[OwRadarDerivedSensorEntityDescription, ...] = (
+    OwRadarDerivedSensorEntityDescription(
+        key="state_heart_rate_estimate",
+        translation_key="state_heart_rate_estimate",
+        native_unit_of_measurement="BPM",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        signal=SIGNAL_RATES,
+        value_fn=lambda coordinator: getattr(
+            coordinator.rates.get("heart"), "rate", None
+        ),
+        attributes_fn=lambda coordinator: _rate_attributes(
+            coordinator.rates.get("heart")
+        ),
+        exists_fn=_websocket_enabled,
+        icon="mdi:heart-pulse",
+    ),
+    OwRadarDerivedSensorEntityDescription(
+        key="state_breath_rate_estimate",
+        translation_key="state_breath_rate_estimate",
+        native_unit_of_measurement="BPM",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        signal=SIGNAL_RATES,
+        value_fn=lambda coordinator: getattr(
+            coordinator.rates.get("breath"), "rate", None
+        ),
+        attributes_fn=lambda coordinator: _rate_attributes(
+            coordinator.rates.get("breath")
+        ),
+        exists_fn=_websocket_enabled,
+        icon="mdi:lungs",
+    ),
+)
+
+# Windowed min, max, mean and RMS of the waves, recorded instead of the samples
+R60ABD1_WAVE_AGGREGATE_SENSORS: tuple[
+    OwRadarDerivedSensorEntityDescription, ...
+] = tuple(
+    OwRadarDerivedSensorEntityDescription(
+        key=f"state_{wave}_waves_{stat}",
+        translation_key=f"state_{wave}_waves_{stat}",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=precision,
+        signal=SIGNAL_AGGREGATES,
+        value_fn=lambda coordinator, wave=wave, name=name: getattr(
+            coordinator.aggregates.get(wave), name, None
+        ),
+        exists_fn=_websocket_enabled,
+        icon="mdi:sine-wave",
+    )
+    for wave in ("heart", "breath")
+    for stat, name, precision in (
+        ("min", "minimum", 0),
+        ("max", "maximum", 0),
+        ("mean", "mean", 1),
+        ("rms", "rms", 1),
+    )
+)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -538,12 +705,19 @@ async def async_setup_entry(
         for description in sensors
         if description.exists_fn(coordinator.data)
     )
+    async_add_entities(
+        OwRadarDerivedSensorEntity(coordinator, description)
+        for description in R60ABD1_RATE_SENSORS + R60ABD1_WAVE_AGGREGATE_SENSORS
+        if description.exists_fn(coordinator.data)
+    )
 
 
 class OwSensorEntity(OwRadarEntity, SensorEntity):
     """Defines a OwRadar sensor entity."""
 
     entity_description: OwRadarSensorEntityDescription
+    # Waveform samples change with every frame, keep them out of the history
+    _unrecorded_attributes = frozenset({"heart_waves", "breath_waves"})
 
     def __init__(
             self,
@@ -554,8 +728,136 @@ class OwSensorEntity(OwRadarEntity, SensorEntity):
         super().__init__(coordinator=coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.data.info.mac_addr}_{description.key}"
+        self._filtered = bool(
+            description.deadband
+            or description.hysteresis
+            or description.min_interval
+            or description.wave_window
+        )
+        # Last written value, its direction of change and when it was written
+        self._written: Any = None
+        self._written_direction = 0
+        self._written_at = 0.0
+        # Wave samples buffered at the last write
+        self._written_samples = 0
+        self._cancel_deferred: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Cancel a deferred write when removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_deferred)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless the write filters drop the new value."""
+        if not self._filtered or not self.available:
+            self._written = None
+            super()._handle_coordinator_update()
+            return
+
+        description = self.entity_description
+        if description.wave_window is not None:
+            samples = max(
+                buffer.total for buffer in self.coordinator.client.waves.values()
+            )
+            # The buffers restart from zero once cleared
+            if 0 <= samples - self._written_samples < description.wave_window:
+                return
+            self._written_samples = samples
+
+        value = description.value_fn(self.coordinator.data)
+        direction = 0
+        if isinstance(value, int | float) and isinstance(self._written, int | float):
+            delta = value - self._written
+            direction = (delta > 0) - (delta < 0)
+            threshold = description.deadband
+            if direction == -self._written_direction:
+                threshold += description.hysteresis
+            if abs(delta) <= threshold:
+                return
+
+        if description.min_interval is not None:
+            wait = (
+                self._written_at
+                + description.min_interval.total_seconds()
+                - time.monotonic()
+            )
+            if wait > 0:
+                # Write the value standing at the end of the interval
+                if self._cancel_deferred is None:
+                    self._cancel_deferred = async_call_later(
+                        self.hass, wait, self._async_deferred_update
+                    )
+                return
+
+        self._async_cancel_deferred()
+        self._written = value
+        self._written_direction = direction or self._written_direction
+        self._written_at = time.monotonic()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_deferred_update(self, _now: datetime) -> None:
+        """Write a value held back by the rate limit."""
+        self._cancel_deferred = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_deferred(self) -> None:
+        """Cancel the pending deferred write, if any."""
+        if self._cancel_deferred is not None:
+            self._cancel_deferred()
+            self._cancel_deferred = None
 
     @property
     def native_value(self) -> datetime | StateType:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator.data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the sensor."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self.coordinator)
+
+
+class OwRadarDerivedSensorEntity(OwRadarEntity, SensorEntity):
+    """Defines a OwRadar sensor entity computed from buffered waves."""
+
+    entity_description: OwRadarDerivedSensorEntityDescription
+
+    def __init__(
+            self,
+            coordinator: OwRadarDataUpdateCoordinator,
+            description: OwRadarDerivedSensorEntityDescription,
+    ) -> None:
+        """Initialize a OwRadar derived sensor entity."""
+        super().__init__(coordinator=coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.data.info.mac_addr}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the new values of the sensor."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.entity_description.signal.format(
+                    self.coordinator.config_entry.entry_id
+                ),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the sensor."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self.coordinator)
@@ -37,6 +37,8 @@ class OwRadarSwitchEntityDescription(
     """Describes OwRadar switch entity."""
 
     exists_fn: Callable[[Any], bool] = lambda _: True
+    # Device fields read by value_fn, resolved from the key when not given
+    fields: tuple[str, ...] | None = None
 
 
 COMMON_SETTING_SWITCHES: tuple[OwRadarSwitchEntityDescription, ...] = (
@@ -0,0 +1,205 @@
+"""Long-term statistics of the vital signs of owradar devices."""
+
+from __future__ import annotations
+
+import inspect
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import CONF_SHORT_TERM_STATISTICS, DOMAIN, LOGGER
+from .core.buckets import OwRadarBucket, OwRadarBucketSeries
+
+try:
+    from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+except ImportError:  # Moved by a newer recorder, see _short_term_importer
+    StatisticsShortTerm = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .coordinator import OwRadarDataUpdateCoordinator
+
+# Device field, name and unit of each vital sign, by statistic suffix
+VITALS = {
+    "heart_rate": ("state.heart.rate", "heart rate", "BPM"),
+    "stats_heart": ("stats.heart", "heart rate statistics", "BPM"),
+    "stats_breath": ("stats.breath", "breath rate statistics", "BPM"),
+}
+
+SHORT_TERM_PERIOD = 300
+LONG_TERM_PERIOD = 3600
+
+
+class OwRadarVitalStatistics:
+    """Compute and import the statistics of the vital signs of a device."""
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: OwRadarDataUpdateCoordinator
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._import_short_term: (
+            Callable[[StatisticMetaData, list[StatisticData]], None] | None
+        ) = None
+        self._paths = {path: vital for vital, (path, _, _) in VITALS.items()}
+        self._series = {
+            vital: (
+                OwRadarBucketSeries(SHORT_TERM_PERIOD),
+                OwRadarBucketSeries(LONG_TERM_PERIOD),
+            )
+            for vital in VITALS
+        }
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Compute and import the statistics until the returned callback is called."""
+        if self.coordinator.config_entry.options.get(CONF_SHORT_TERM_STATISTICS):
+            self._import_short_term = _short_term_importer(self.hass)
+        now = time.time()
+        device = self.coordinator.data
+        for path, vital in self._paths.items():
+            self._async_update(vital, _reading(device, path), now)
+        unsub_fields = self.coordinator.client.subscribe(
+            self._async_fields_changed, *self._paths
+        )
+        # Close the periods shortly after each 5 minute boundary
+        unsub_flush = async_track_utc_time_change(
+            self.hass, self._async_flush, minute="/5", second=1
+        )
+
+        @callback
+        def stop() -> None:
+            unsub_fields()
+            unsub_flush()
+
+        return stop
+
+    @callback
+    def _async_fields_changed(self, device: object, changed: frozenset[str]) -> None:
+        """Fold the vital signs that changed into their periods."""
+        now = time.time()
+        for path in changed:
+            self._async_update(self._paths[path], _reading(device, path), now)
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Close the periods that ended, holding the current values."""
+        now = time.time()
+        for vital, series in self._series.items():
+            self._async_import(vital, *(periods.flush(now) for periods in series))
+
+    @callback
+    def _async_update(self, vital: str, value: float | None, now: float) -> None:
+        """Record a new value of a vital sign."""
+        self._async_import(
+            vital, *(periods.update(value, now) for periods in self._series[vital])
+        )
+
+    @callback
+    def _async_import(
+        self,
+        vital: str,
+        short_term: list[OwRadarBucket],
+        long_term: list[OwRadarBucket],
+    ) -> None:
+        """Import the closed periods of a vital sign into the recorder."""
+        if self._import_short_term is None:
+            short_term = []
+        if not short_term and not long_term:
+            return
+        _, name, unit = VITALS[vital]
+        info = self.coordinator.data.info
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{info.name} {name}",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{slugify(info.mac_addr)}_{vital}",
+            unit_of_measurement=unit,
+        )
+        LOGGER.debug(
+            "Importing %s 5 minute and %s hourly statistics of %s",
+            len(short_term),
+            len(long_term),
+            metadata["statistic_id"],
+        )
+        if short_term:
+            self._import_short_term(metadata, _statistics(short_term))
+        if long_term:
+            async_add_external_statistics(self.hass, metadata, _statistics(long_term))
+
+
+def _short_term_importer(
+    hass: HomeAssistant,
+) -> Callable[[StatisticMetaData, list[StatisticData]], None] | None:
+    """
+    Return the function importing 5 minute statistics, None if unavailable.
+
+    `async_add_external_statistics` only takes hourly statistics. The
+    private `Recorder.async_import_statistics` queues statistics into any
+    statistics table; its signature is checked once, so a recorder that
+    changed it only loses the 5 minute statistics.
+    """
+    import_statistics = getattr(get_instance(hass), "async_import_statistics", None)
+    if _accepts(import_statistics, {}, [], StatisticsShortTerm):
+
+        @callback
+        def import_short_term(
+            metadata: StatisticMetaData, statistics: list[StatisticData]
+        ) -> None:
+            import_statistics(metadata, statistics, StatisticsShortTerm)
+
+        return import_short_term
+    LOGGER.warning(
+        "The recorder cannot import 5 minute statistics, "
+        "only hourly vital sign statistics are imported"
+    )
+    return None
+
+
+def _accepts(function: Callable[..., Any] | None, *args: Any) -> bool:
+    """Return if a function can be called with args."""
+    if function is None or None in args:
+        return False
+    try:
+        inspect.signature(function).bind(*args)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _reading(device: object, path: str) -> float | None:
+    """Return a vital sign of a device, None without a reading."""
+    value = device
+    for name in path.split("."):
+        value = getattr(value, name)
+    # The radar reports 0 when nobody is measured
+    return float(value) if value > 0 else None
+
+
+def _statistics(buckets: list[OwRadarBucket]) -> list[StatisticData]:
+    """Convert closed periods to recorder statistics."""
+    return [
+        StatisticData(
+            start=dt_util.utc_from_timestamp(bucket.start),
+            mean=bucket.mean,
+            min=bucket.minimum,
+            max=bucket.maximum,
+        )
+        for bucket in buckets
+    ]
@@ -0,0 +1,34 @@
+"""Tests of the DSP process pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+from core.dsp import HEART_BAND
+from core.pool import OwRadarDspPool
+
+
+def test_worker_killed() -> None:
+    """A dead worker drops the batch in flight, then the pool is replaced."""
+    windows = np.random.default_rng(0).normal(size=(4, 512))
+
+    async def run(pool: OwRadarDspPool) -> None:
+        assert await pool.estimate(windows, HEART_BAND) is not None
+        slots = list(pool._slots)  # noqa: SLF001
+        for process in pool._executor._processes.values():  # noqa: SLF001
+            process.kill()
+
+        assert await pool.estimate(windows, HEART_BAND) is None
+        assert pool.stats.restarts == 1
+        assert not any(slot in pool._slots for slot in slots)  # noqa: SLF001
+
+        assert await pool.estimate(windows, HEART_BAND) is not None
+        assert pool.stats.completed == 2  # noqa: PLR2004
+
+    pool = OwRadarDspPool()
+    pool.start()
+    try:
+        asyncio.run(run(pool))
+    finally:
+        pool.shutdown()
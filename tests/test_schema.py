@@ -0,0 +1,36 @@
+"""Tests of the schema driven updaters."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from core.r60abd1_models import (
+    OwRadarR60abd1Device,
+    OwRadarR60abd1StateBodyPresence,
+)
+
+
+@pytest.mark.parametrize("presence", [None, "1", 1.5, [1]])
+def test_invalid_enum_value(presence: Any) -> None:
+    """An enum field sent a non-integer keeps its value, the others update."""
+    device = OwRadarR60abd1Device()
+    device.state.update_from_dict({"body": {"presence": 1}})
+
+    changes = device.state.update_changes(
+        {"body": {"presence": presence, "distance": 120}}, "state."
+    )
+    device.state.update_from_dict({"body": {"presence": presence}})
+
+    assert changes == {"state.body.distance"}
+    assert device.state.body.presence is OwRadarR60abd1StateBodyPresence.SOMEBODY
+    assert device.state.body.distance == 120  # noqa: PLR2004
+
+
+def test_unknown_enum_value() -> None:
+    """An integer unknown to the enum gives a pseudo-member."""
+    device = OwRadarR60abd1Device()
+    device.state.update_from_dict({"body": {"presence": 7}})
+
+    assert device.state.body.presence == 7  # noqa: PLR2004
+    assert device.state.body.presence.name == "UNKNOWN_7"
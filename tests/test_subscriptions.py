@@ -0,0 +1,51 @@
+"""Tests of the field subscriptions."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from core.exceptions import OwRadarError
+from core.r60abd1_models import OwRadarR60abd1Device
+from core.subscriptions import OwRadarSubscriptions
+
+FRAME = {
+    "timestamp": 1,
+    "body": {"presence": 1, "distance": 120, "location": {"x": 10, "y": -20}},
+    "heart": {"rate": 72},
+}
+
+
+@pytest.mark.parametrize("tracked", [True, False])
+def test_subscribe_parent_path(tracked: bool) -> None:  # noqa: FBT001
+    """A nested model is subscribed to through each of its fields."""
+    device = OwRadarR60abd1Device()
+    subscriptions = OwRadarSubscriptions()
+    calls: list[frozenset[str]] = []
+
+    def callback(_device: Any, changed: frozenset[str]) -> None:
+        calls.append(changed)
+
+    subscriptions.subscribe(callback, ("state.body",), device)
+    if tracked:
+        changes = device.state.update_changes(FRAME, "state.")
+    else:
+        device.state.update_from_dict(FRAME)
+        changes = None
+    subscriptions.notify(device, "state", changes)
+
+    assert calls == [
+        {
+            "state.body.presence",
+            "state.body.distance",
+            "state.body.location.x",
+            "state.body.location.y",
+        }
+    ]
+
+
+def test_subscribe_unknown_path() -> None:
+    """A path that is not a field of the model is rejected."""
+    subscriptions = OwRadarSubscriptions()
+    with pytest.raises(OwRadarError):
+        subscriptions.subscribe(lambda *_: None, ("state.bod",), OwRadarR60abd1Device())